@@ -1,2 +1,3 @@
 from .case import TestCase
-from .decorator import args
+from .decorator import args, args_from, timeout
+from .fixture import pooled
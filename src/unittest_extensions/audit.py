@@ -0,0 +1,152 @@
+import os
+import sys
+import sysconfig
+import threading
+from contextlib import contextmanager
+from types import FrameType
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# The counter of `IOUsage` incremented by each audited event; sqlite3.connect
+# is raised on Python >= 3.10.
+_EVENT_COUNTERS = {
+    "open": "opens",
+    "socket.__new__": "sockets",
+    "socket.connect": "connections",
+    "sqlite3.connect": "connections",
+}
+
+
+class IOUsage:
+    """
+    The I/O performed while recording with `record_io`.
+
+    `opens` counts files opened through `open`, `io.open_code` and `os.open`,
+    `sockets` counts sockets created, whether or not they connect, and
+    `connections` counts socket and sqlite3 connections; `calls` lists every
+    such call as (event, argument, call site). Calls made from every thread
+    while recording are counted, not only those of the recording thread. The
+    call site is the innermost frame outside the standard library and
+    `unittest_extensions`. `bytes_read` and `bytes_written` are the bytes
+    transferred by the whole process, and are None where the platform does
+    not report them (anywhere but Linux).
+    """
+
+    def __init__(self):
+        self.opens = 0
+        self.sockets = 0
+        self.connections = 0
+        self.bytes_read: Optional[int] = None
+        self.bytes_written: Optional[int] = None
+        self.calls: List[Tuple[str, str, str]] = []
+
+
+_recording: List[IOUsage] = []
+_lock = threading.Lock()
+_installed = False
+
+_PACKAGE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+_STDLIB_DIRECTORIES = tuple(
+    os.path.abspath(sysconfig.get_paths()[name]) + os.sep
+    for name in ("stdlib", "platstdlib")
+)
+_SITE_DIRECTORIES = tuple(
+    os.path.abspath(sysconfig.get_paths()[name]) + os.sep
+    for name in ("purelib", "platlib")
+)
+# Whether each file seen in a call site is part of the standard library or of
+# this package, by file name.
+_library_files: Dict[str, bool] = {}
+
+
+def _is_library(filename: str) -> bool:
+    library = _library_files.get(filename)
+    if library is None:
+        path = os.path.abspath(filename)
+        library = (
+            filename.startswith("<frozen")
+            or os.path.dirname(path) == _PACKAGE_DIRECTORY
+            or (
+                path.startswith(_STDLIB_DIRECTORIES)
+                and not path.startswith(_SITE_DIRECTORIES)
+            )
+        )
+        _library_files[filename] = library
+    return library
+
+
+def _call_site(frame: FrameType) -> str:
+    site: Optional[FrameType] = frame
+    while site is not None and _is_library(site.f_code.co_filename):
+        site = site.f_back
+    if site is None:
+        site = frame
+    return f"{site.f_code.co_filename}:{site.f_lineno} in {site.f_code.co_name}"
+
+
+def _hook(event: str, args: tuple):
+    if not _recording:
+        return
+    kind = _EVENT_COUNTERS.get(event)
+    if kind is None:
+        return
+    site = _call_site(sys._getframe(1))
+    argument = repr(args[0]) if args else ""
+    if event == "socket.connect" and len(args) > 1:
+        argument = repr(args[1])
+    for usage in list(_recording):
+        setattr(usage, kind, getattr(usage, kind) + 1)
+        usage.calls.append((event, argument, site))
+
+
+def _install():
+    global _installed
+    with _lock:
+        if not _installed:
+            # Audit hooks cannot be removed; the hook returns immediately when
+            # nothing is being recorded.
+            sys.addaudithook(_hook)
+            _installed = True
+
+
+def _io_counters() -> Optional[Tuple[int, int, int]]:
+    """
+    Return the bytes read and written by the process, and the bytes read to
+    find these out, from /proc/self/io.
+    """
+    try:
+        with open("/proc/self/io", "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    fields = dict(line.split(b": ", 1) for line in data.splitlines() if b": " in line)
+    return int(fields[b"rchar"]), int(fields[b"wchar"]), len(data)
+
+
+@contextmanager
+def record_io() -> Iterator[IOUsage]:
+    """
+    Record the I/O performed inside the `with` block, by any thread of the
+    process.
+
+    Examples:
+        >>> from unittest_extensions.audit import record_io
+
+        >>> with record_io() as usage:
+        ...     with open("config.ini") as f:
+        ...         _ = f.read()
+        >>> usage.opens
+        1
+    """
+    _install()
+    usage = IOUsage()
+    before = _io_counters()
+    _recording.append(usage)
+    try:
+        yield usage
+    finally:
+        _recording.remove(usage)
+        after = _io_counters()
+        if before is not None and after is not None:
+            # The read of the first counters is only accounted for after it.
+            usage.bytes_read = after[0] - before[0] - before[2]
+            usage.bytes_written = after[1] - before[1]
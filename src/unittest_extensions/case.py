@@ -1,10 +1,15 @@
 from unittest import TestCase as BaseTestCase
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 from abc import abstractmethod
 from warnings import warn
 from copy import deepcopy
+from time import perf_counter
 
+from unittest_extensions.audit import record_io
 from unittest_extensions.error import TestError
+from unittest_extensions.fingerprint import fingerprint
+from unittest_extensions.frame import compare_frames
+from unittest_extensions.watchdog import Timeout, call_within
 
 
 class TestCase(BaseTestCase):
@@ -37,8 +42,20 @@ class TestCase(BaseTestCase):
         ...     @args("1", b="2")
         ...     def test_str_plus_str(self):
         ...         self.assertResult("12")
+
+    Set `checkSubjectArgsMutation` to True in your test-case class to fail
+    tests whose subject mutates the arguments it receives from `args`.
+
+    Set `subjectTimeout` to a number of seconds to fail tests whose subject
+    call does not complete in time; override it for single test methods with
+    the @timeout decorator.
     """
 
+    checkSubjectArgsMutation = False
+    maxIOCallsReported = 20
+    maxFrameRowsReported = 10
+    subjectTimeout: Optional[float] = None
+
     @abstractmethod
     def subject(self, *args, **kwargs) -> Any:
         raise TestError("No 'subject' method found; perhaps you mispelled it?")
@@ -70,11 +87,26 @@ class TestCase(BaseTestCase):
     def result(self) -> Any:
         """
         Result of the `subject` called with arguments defined by the `args` decorator.
+
+        If a timeout is set, a watchdog writes the subject's stack to standard
+        error as soon as the timeout is exceeded and interrupts the subject; the
+        test then fails with the same stack.
         """
+        return self._result(getattr(self, "_subjectTimeout", self.subjectTimeout))
+
+    def _result(self, timeout: Optional[float]) -> Any:
+        if self.checkSubjectArgsMutation:
+            fingerprints = self._subjectArgsFingerprints()
+        start = perf_counter()
         try:
-            self._subjectResult = self.subject(
-                *self._subjectArgs, **self._subjectKwargs
-            )
+            if timeout is None:
+                self._subjectResult = self.subject(
+                    *self._subjectArgs, **self._subjectKwargs
+                )
+            else:
+                self._subjectResult = self._callSubjectWithin(timeout)
+            if self.checkSubjectArgsMutation:
+                self._assertSubjectArgsNotMutated(fingerprints)
             return self._subjectResult
         except Exception as e:
             if len(e.args) == 0:
@@ -94,6 +126,37 @@ class TestCase(BaseTestCase):
                     + ". Did you decorate all test methods with 'args'?"
                 )
             raise e
+        finally:
+            self._subjectDuration = perf_counter() - start
+
+    def _callSubjectWithin(self, seconds: float) -> Any:
+        try:
+            return call_within(
+                seconds, self.subject, *self._subjectArgs, **self._subjectKwargs
+            )
+        except Timeout as e:
+            stack = e.stack
+        self.fail(
+            f"Subject did not complete within {seconds} seconds; its stack is:\n"
+            + stack
+        )
+
+    def _subjectArgsFingerprints(self) -> Dict[Any, bytes]:
+        fingerprints: Dict[Any, bytes] = {
+            i: fingerprint(arg) for i, arg in enumerate(self._subjectArgs)
+        }
+        for key, value in self._subjectKwargs.items():
+            fingerprints[key] = fingerprint(value)
+        return fingerprints
+
+    def _assertSubjectArgsNotMutated(self, fingerprints: Dict[Any, bytes]):
+        mutated = [
+            f"positional argument {key}" if isinstance(key, int) else repr(key)
+            for key, value in self._subjectArgsFingerprints().items()
+            if fingerprints.get(key) != value
+        ]
+        if mutated:
+            self.fail("Subject mutated its " + ", ".join(mutated))
 
     def cachedResult(self) -> Any:
         """
@@ -352,6 +415,91 @@ class TestCase(BaseTestCase):
         """
         self.assertDictEqual(self.result(), dct)
 
+    def assertResultFrame(
+        self,
+        expected,
+        rtol: Optional[float] = None,
+        check_order: bool = True,
+        chunk_size: int = 65536,
+    ):
+        """
+        Assert that the result is a table equal to expected, comparing column by
+        column in chunks of `chunk_size` rows and stopping at the first chunk
+        that differs.
+
+        The result and expected may be pandas DataFrames, pyarrow Tables or
+        RecordBatches, or lists of records (dicts) or rows. Numbers are
+        compared with the relative tolerance `rtol`, if given. If `check_order`
+        is False the order of the rows is ignored and rows must be exactly
+        equal. The failure message shows at most `maxFrameRowsReported`
+        differing rows.
+        """
+        difference = compare_frames(
+            self.result(),
+            expected,
+            rtol,
+            check_order,
+            chunk_size,
+            self.maxFrameRowsReported,
+        )
+        if difference is not None:
+            self.fail(difference)
+
+    def assertResultCompletesWithin(self, seconds: float):
+        """
+        Fail if the subject does not complete within the given number of
+        seconds, reporting where the subject hangs.
+        """
+        self._result(seconds)
+
+    def assertResultIOBelow(
+        self,
+        opens: Optional[int] = None,
+        bytes_read: Optional[int] = None,
+        bytes_written: Optional[int] = None,
+        connections: Optional[int] = None,
+        sockets: Optional[int] = None,
+    ):
+        """
+        Fail if the subject opens more files, reads or writes more bytes, opens
+        more socket or sqlite3 connections, or creates more sockets than given.
+        Budgets left to None are not checked.
+
+        Files, connections and sockets are counted through audit hooks, in every
+        thread, and the failure message lists the lines that opened them outside
+        the standard library. Bytes are those transferred by the whole process
+        while the subject ran, as reported by /proc/self/io; asserting them
+        raises `unittest_extensions.TestError` on platforms other than Linux.
+        """
+        with record_io() as usage:
+            self.result()
+
+        budgets = {
+            "opens": opens,
+            "bytes_read": bytes_read,
+            "bytes_written": bytes_written,
+            "connections": connections,
+            "sockets": sockets,
+        }
+        exceeded = []
+        for name, budget in budgets.items():
+            if budget is None:
+                continue
+            value = getattr(usage, name)
+            if value is None:
+                raise TestError(f"Cannot assert {name}; /proc/self/io is not available")
+            if value > budget:
+                exceeded.append(f"{name}={value} (budget {budget})")
+        if exceeded:
+            limit = self.maxIOCallsReported
+            calls = "".join(
+                f"\n  {event}({argument}) at {site}"
+                for event, argument, site in usage.calls[:limit]
+            )
+            if len(usage.calls) > limit:
+                calls += f"\n  ... and {len(usage.calls) - limit} more"
+            self.fail("Subject exceeded its I/O budget: " + ", ".join(exceeded) + calls)
+
     def _callTestMethod(self, method):
         if hasattr(method, "_subjectArgs"):
             self._subjectArgs = method._subjectArgs
@@ -363,6 +511,8 @@ class TestCase(BaseTestCase):
         else:
             self._subjectKwargs = {}
 
+        self._subjectTimeout = getattr(method, "_subjectTimeout", self.subjectTimeout)
+
         if method() is not None:
             warn(
                 f"It is deprecated to return a value that is not None from a "
@@ -372,3 +522,4 @@ class TestCase(BaseTestCase):
             )
         self._subjectKwargs = {}
         self._subjectArgs = tuple()
+        self._subjectTimeout = self.subjectTimeout
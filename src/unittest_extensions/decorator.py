@@ -1,4 +1,14 @@
 import functools
+import hashlib
+import math
+import os
+import pickle
+import random
+import unittest
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from unittest_extensions.error import TestError
 
 
 def args(*args, **kwargs):
@@ -41,3 +51,271 @@ def args(*args, **kwargs):
         return wrapped_test_method
 
     return args_decorator
+
+
+def timeout(seconds: float):
+    """
+    Decorate test methods to fail them if a call of your `subject` does not
+    complete within the given number of seconds. Overrides the
+    `subjectTimeout` of the test case.
+
+    Examples:
+        >>> from unittest_extensions import TestCase, args, timeout
+
+        >>> class TestSolve(TestCase):
+        ...     def subject(self, puzzle):
+        ...         return solve(puzzle)
+
+        ...     @timeout(0.5)
+        ...     @args("hard-puzzle")
+        ...     def test_solves_hard_puzzle(self):
+        ...         self.assertResultTrue()
+    """
+
+    def timeout_decorator(test_method):
+        test_method._subjectTimeout = seconds
+        return test_method
+
+    return timeout_decorator
+
+
+def args_from(
+    strategy: Callable[[random.Random], Any],
+    max_examples: int = 100,
+    time_budget: Optional[float] = None,
+    seed: Optional[int] = None,
+):
+    """
+    Decorate test methods to run them with arguments for your `subject`
+    generated by `strategy`, one set of arguments at a time.
+
+    `strategy` receives a `random.Random` instance and returns the arguments of
+    one example: a tuple of positional arguments, a dict of keyword arguments
+    or any other object as the single positional argument. At most
+    `max_examples` examples are run, and no new example is started, nor a
+    failing one shrunk further, once `time_budget` seconds have passed.
+
+    When an example fails, it is shrunk to a minimal failing example, which is
+    reported and saved under the directory named by the
+    `UNITTEST_EXTENSIONS_EXAMPLES` environment variable (by default
+    `.unittest_extensions_examples`), so that it is run first the next time.
+
+    Examples:
+        >>> from unittest_extensions import TestCase, args_from
+
+        >>> class TestAbs(TestCase):
+        ...     def subject(self, x):
+        ...         return abs(x)
+
+        ...     @args_from(lambda rng: rng.randint(-1000, 1000), time_budget=1)
+        ...     def test_non_negative(self):
+        ...         self.assertResultGreaterEqual(0)
+    """
+
+    def args_from_decorator(test_method):
+        @functools.wraps(test_method)
+        def wrapped_test_method(self, *_args, **_kwargs):
+            def run(example) -> Optional[Exception]:
+                self._subjectArgs, self._subjectKwargs = _subject_arguments(example)
+                if hasattr(self, "_subjectResult"):
+                    del self._subjectResult
+                try:
+                    test_method(self, *_args, **_kwargs)
+                except unittest.SkipTest:
+                    raise
+                except Exception as e:
+                    return e
+                return None
+
+            cache = _ExampleCache(self.id())
+            deadline = None if time_budget is None else perf_counter() + time_budget
+            for example in _examples(cache, strategy, max_examples, deadline, seed):
+                error = run(example)
+                if error is not None:
+                    break
+            else:
+                cache.clear()
+                return None
+
+            example, error = _shrink(run, example, error, deadline)
+            cache.save(example)
+            positional, keyword = _subject_arguments(example)
+            note = f"Falsifying example: args={positional!r}, kwargs={keyword!r}"
+            if isinstance(error, self.failureException):
+                raise self.failureException(f"{error}\n{note}") from error
+            raise TestError(f"{type(error).__name__}: {error}\n{note}") from error
+
+        return wrapped_test_method
+
+    return args_from_decorator
+
+
+def _subject_arguments(example) -> Tuple[Tuple, Dict[str, Any]]:
+    if isinstance(example, tuple):
+        return example, {}
+    if isinstance(example, dict):
+        return tuple(), example
+    return (example,), {}
+
+
+def _examples(
+    cache: "_ExampleCache",
+    strategy: Callable[[random.Random], Any],
+    max_examples: int,
+    deadline: Optional[float],
+    seed: Optional[int],
+) -> Iterator[Any]:
+    if cache.exists():
+        try:
+            example = cache.load()
+        except Exception:
+            # The example was saved by a different version of the code or the
+            # file is corrupt; it is dropped rather than failing the test.
+            cache.clear()
+        else:
+            yield example
+    rng = random.Random(seed)
+    for _ in range(max_examples):
+        if _expired(deadline):
+            return
+        yield strategy(rng)
+
+
+def _expired(deadline: Optional[float]) -> bool:
+    return deadline is not None and perf_counter() > deadline
+
+
+class _ExampleCache:
+    """
+    The failing example of a test method, saved on disk.
+    """
+
+    def __init__(self, test_id: str):
+        directory = os.environ.get(
+            "UNITTEST_EXTENSIONS_EXAMPLES", ".unittest_extensions_examples"
+        )
+        name = hashlib.sha1(test_id.encode()).hexdigest()
+        self.path = os.path.join(directory, name)
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def load(self) -> Any:
+        with open(self.path, "rb") as f:
+            return pickle.load(f)
+
+    def save(self, example: Any):
+        try:
+            data = pickle.dumps(example)
+        except Exception:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "wb") as f:
+            f.write(data)
+
+    def clear(self):
+        if self.exists():
+            os.remove(self.path)
+
+
+# Upper bound of the test runs spent on shrinking a failing example.
+_MAX_SHRINK_RUNS = 1000
+
+
+def _shrink(
+    run: Callable[[Any], Optional[Exception]],
+    example: Any,
+    error: Exception,
+    deadline: Optional[float] = None,
+) -> Tuple[Any, Exception]:
+    """
+    Greedily replace `example` with simpler candidates that still fail with
+    the same type of error, until none does, or `deadline` (a
+    `time.perf_counter` value) passes.
+    """
+    runs = 0
+    shrunk = True
+    while shrunk and runs < _MAX_SHRINK_RUNS:
+        shrunk = False
+        for candidate in _example_candidates(example):
+            if _expired(deadline):
+                return example, error
+            runs += 1
+            candidate_error = run(candidate)
+            if candidate_error is not None and type(candidate_error) is type(error):
+                example, error, shrunk = candidate, candidate_error, True
+                break
+            if runs >= _MAX_SHRINK_RUNS:
+                break
+    return example, error
+
+
+def _example_candidates(example) -> Iterator[Any]:
+    # The arity of positional arguments and the names of keyword arguments are
+    # kept, only their values are shrunk.
+    if isinstance(example, tuple):
+        for i, value in enumerate(example):
+            for candidate in _candidates(value):
+                yield example[:i] + (candidate,) + example[i + 1 :]
+    elif isinstance(example, dict):
+        for key, value in example.items():
+            for candidate in _candidates(value):
+                yield {**example, key: candidate}
+    else:
+        yield from _candidates(example)
+
+
+def _candidates(value) -> Iterator[Any]:
+    """
+    Yield values simpler than `value`, simplest first.
+    """
+    if isinstance(value, bool):
+        if value:
+            yield False
+    elif isinstance(value, int):
+        if value != 0:
+            yield 0
+        if abs(value) > 1:
+            # Halve towards zero; integer division keeps big ints exact.
+            yield value // 2 if value > 0 else -(-value // 2)
+            yield value - 1 if value > 0 else value + 1
+        if value < 0:
+            yield -value
+    elif isinstance(value, float):
+        if value != 0.0:
+            yield 0.0
+        if math.isfinite(value):
+            if value != int(value):
+                yield float(int(value))
+            if abs(value) > 1:
+                yield value / 2
+    elif isinstance(value, (str, bytes, list, tuple)):
+        yield from _sequence_candidates(value)
+    elif isinstance(value, dict):
+        for key in value:
+            yield {k: v for k, v in value.items() if k != key}
+        for key, item in value.items():
+            for candidate in _candidates(item):
+                yield {**value, key: candidate}
+
+
+def _sequence_candidates(value: Any) -> Iterator[Any]:
+    """
+    Yield sequences of the type of `value` (a str, bytes, list or tuple)
+    simpler than it, simplest first.
+    """
+    if len(value) > 0:
+        yield value[:0]
+    if len(value) > 1:
+        half = len(value) // 2
+        yield value[:half]
+        yield value[half:]
+    if 1 < len(value) <= 32:
+        for i in range(len(value)):
+            yield value[:i] + value[i + 1 :]
+    if isinstance(value, (list, tuple)):
+        for i, item in enumerate(value):
+            for candidate in _candidates(item):
+                items = list(value)
+                items[i] = candidate
+                yield type(value)(items)
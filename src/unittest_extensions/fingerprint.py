@@ -0,0 +1,178 @@
+import io
+import pickle
+import zlib
+from hashlib import sha1
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Set
+
+# Objects hashed by identity rather than by contents.
+_IDENTITY_TYPES = (type, FunctionType, BuiltinFunctionType, MethodType, ModuleType)
+
+
+def fingerprint(obj: Any) -> bytes:
+    """
+    Return a structural hash of `obj`.
+
+    Two objects with equal structure and contents have the same fingerprint,
+    whereas mutating an object (or anything it contains) changes its
+    fingerprint. Sets are hashed regardless of their iteration order, and
+    buffers such as bytearrays, arrays and numpy arrays are summarized with a
+    CRC-32 checksum of their memory, without copying.
+
+    Examples:
+        >>> from unittest_extensions.fingerprint import fingerprint
+
+        >>> lst = [1, {"a": b"xyz"}]
+        >>> before = fingerprint(lst)
+        >>> lst[1]["a"] = b"xy"
+        >>> fingerprint(lst) == before
+        False
+    """
+    if type(obj) in (bytes, bytearray):
+        return _buffer_fingerprint(memoryview(obj))
+    stream = io.BytesIO()
+    try:
+        _FingerprintPickler(stream, pickle.HIGHEST_PROTOCOL).dump(obj)
+    except Exception:
+        # Objects that cannot be pickled are walked in Python instead.
+        digest = sha1()
+        _update(digest, obj, set())
+        return digest.digest()
+    return sha1(stream.getbuffer()).digest()
+
+
+def _identity(id_: int):
+    pass
+
+
+def _buffer(format_: str, shape: tuple, nbytes: int, checksum: int):
+    pass
+
+
+def _buffer_checksum(view: memoryview) -> int:
+    if view.c_contiguous:
+        return zlib.crc32(view)
+    return zlib.crc32(view.tobytes())
+
+
+def _buffer_fingerprint(view: memoryview) -> bytes:
+    with view:
+        header = f"{view.format}{view.shape}{view.nbytes}".encode()
+        return header + _buffer_checksum(view).to_bytes(4, "little")
+
+
+class _FingerprintPickler(pickle.Pickler):
+    """
+    Pickles objects to a stream that is only hashed, never unpickled, so that
+    functions and classes are replaced by their identity and buffers by their
+    checksum.
+
+    Exact instances of builtin scalars and containers are pickled in C without
+    calling `reducer_override`.
+    """
+
+    def persistent_id(self, obj):
+        # Bytearrays and sets are pickled in C, without calling
+        # `reducer_override`. Sets are pickled in iteration order, which depends
+        # on their history, so their elements are hashed and sorted instead.
+        if type(obj) is bytearray:
+            return _buffer_fingerprint(memoryview(obj))
+        if isinstance(obj, (set, frozenset)):
+            return type(obj).__qualname__, sorted(fingerprint(item) for item in obj)
+        return None
+
+    def reducer_override(self, obj):
+        if obj is _identity or obj is _buffer:
+            return NotImplemented
+        if isinstance(obj, _IDENTITY_TYPES):
+            return _identity, (id(obj),)
+        try:
+            view = memoryview(obj)
+        except TypeError:
+            return NotImplemented
+        with view:
+            return _buffer, (
+                view.format,
+                view.shape,
+                view.nbytes,
+                _buffer_checksum(view),
+            )
+
+
+# Tags distinguishing the kinds of objects walked by `_update`.
+_SCALAR, _STR, _BYTES, _IDENTITY, _CYCLE, _SEQUENCE, _DICT, _SET, _BUFFER, _OBJECT = (
+    bytes([i]) for i in range(10)
+)
+
+
+def _update_bytes(digest, tag: bytes, data):
+    digest.update(tag)
+    digest.update(len(data).to_bytes(8, "little"))
+    digest.update(data)
+
+
+def _update(digest, obj: Any, seen: Set[int]):
+    cls = type(obj)
+    if obj is None or cls in (bool, int, float, complex):
+        _update_bytes(digest, _SCALAR, repr(obj).encode())
+        return
+    if cls is str:
+        _update_bytes(digest, _STR, obj.encode("utf-8", "surrogatepass"))
+        return
+    if cls in (bytes, bytearray):
+        _update_bytes(digest, _BYTES, _buffer_fingerprint(memoryview(obj)))
+        return
+    if isinstance(obj, _IDENTITY_TYPES):
+        _update_bytes(digest, _IDENTITY, id(obj).to_bytes(8, "little"))
+        return
+
+    if id(obj) in seen:
+        digest.update(_CYCLE)
+        return
+    seen.add(id(obj))
+    try:
+        if isinstance(obj, (list, tuple)):
+            digest.update(_SEQUENCE + len(obj).to_bytes(8, "little"))
+            for item in obj:
+                _update(digest, item, seen)
+        elif isinstance(obj, dict):
+            digest.update(_DICT + len(obj).to_bytes(8, "little"))
+            for key, value in obj.items():
+                _update(digest, key, seen)
+                _update(digest, value, seen)
+        elif isinstance(obj, (set, frozenset)):
+            digest.update(_SET + len(obj).to_bytes(8, "little"))
+            for item in sorted(fingerprint(item) for item in obj):
+                digest.update(item)
+        elif not _update_buffer(digest, obj):
+            _update_attributes(digest, obj, seen)
+    finally:
+        seen.discard(id(obj))
+
+
+def _update_buffer(digest, obj: Any) -> bool:
+    try:
+        view = memoryview(obj)
+    except TypeError:
+        return False
+    _update_bytes(digest, _BUFFER, _buffer_fingerprint(view))
+    return True
+
+
+def _update_attributes(digest, obj: Any, seen: Set[int]):
+    _update_bytes(digest, _OBJECT, type(obj).__qualname__.encode())
+    attributes = getattr(obj, "__dict__", None)
+    slots = [
+        slot
+        for klass in type(obj).__mro__
+        for slot in getattr(klass, "__slots__", ())
+        if hasattr(obj, slot)
+    ]
+    if attributes is None and not slots:
+        _update_bytes(digest, _OBJECT, repr(obj).encode("utf-8", "surrogatepass"))
+        return
+    if attributes is not None:
+        _update(digest, attributes, seen)
+    for slot in slots:
+        _update_bytes(digest, _OBJECT, slot.encode())
+        _update(digest, getattr(obj, slot), seen)
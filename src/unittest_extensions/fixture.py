@@ -0,0 +1,185 @@
+import atexit
+import threading
+from typing import Any, Callable, Dict, List, Optional, Type
+from unittest import TestCase as BaseTestCase
+
+from unittest_extensions.error import TestError
+
+
+class _Pool:
+    """
+    A thread-safe pool of objects created on demand, holding at most
+    `max_size` objects (unbounded if None).
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        close: Optional[Callable[[Any], Any]] = None,
+    ):
+        self.max_size = max_size
+        self.close = close
+        self._idle: List[Any] = []
+        self._size = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, create: Callable[[], Any]) -> Any:
+        with self._condition:
+            while not self._idle and self._full():
+                self._condition.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._size += 1
+        try:
+            return create()
+        except BaseException:
+            self._discard()
+            raise
+
+    def release(self, obj: Any):
+        with self._condition:
+            self._idle.append(obj)
+            self._condition.notify()
+
+    def discard(self, obj: Any):
+        self._discard()
+        if self.close is not None:
+            self.close(obj)
+
+    def clear(self):
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._condition.notify_all()
+        if self.close is not None:
+            for obj in idle:
+                self.close(obj)
+
+    def _full(self) -> bool:
+        return self.max_size is not None and self._size >= self.max_size
+
+    def _discard(self):
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+
+class PooledFixture:
+    """
+    Descriptor returned by `pooled`. Accessing it on a test case borrows an
+    object from the pool for the rest of the test; the object is reset and
+    returned to the pool when the test's cleanups run.
+    """
+
+    scopes = ("class", "process")
+
+    def __init__(
+        self,
+        factory: Callable[[Any], Any],
+        scope: str = "class",
+        reset: Optional[Callable[[Any], Any]] = None,
+        close: Optional[Callable[[Any], Any]] = None,
+        max_size: Optional[int] = None,
+    ):
+        if scope not in self.scopes:
+            raise TestError(
+                f"Invalid pooled fixture scope {scope!r}; expected one of {self.scopes}"
+            )
+        self.factory = factory
+        self.scope = scope
+        self.reset = reset
+        self.close = close
+        self.max_size = max_size
+        self.name = factory.__name__
+        self.__doc__ = factory.__doc__
+        self._pools: Dict[Optional[type], _Pool] = {}
+        self._lock = threading.Lock()
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        pool = self._pool(type(instance))
+        obj = pool.acquire(lambda: self.factory(instance))
+        # Later accesses within the same test find the object in the instance
+        # dictionary, which takes precedence over this (non-data) descriptor.
+        instance.__dict__[self.name] = obj
+        instance.addCleanup(self._release, instance, pool, obj)
+        return obj
+
+    def _pool(self, cls: Type[BaseTestCase]) -> _Pool:
+        key = cls if self.scope == "class" else None
+        with self._lock:
+            if key not in self._pools:
+                self._pools[key] = _Pool(self.max_size, self.close)
+                if key is None:
+                    atexit.register(self._clearPool, key)
+                else:
+                    cls.addClassCleanup(self._clearPool, key)
+            return self._pools[key]
+
+    def _clearPool(self, key: Optional[type]):
+        # The pool is forgotten so that a later run of the class creates a new
+        # one and registers its cleanup again.
+        with self._lock:
+            pool = self._pools.pop(key, None)
+        if pool is not None:
+            pool.clear()
+
+    def _release(self, instance, pool: _Pool, obj: Any):
+        instance.__dict__.pop(self.name, None)
+        if self.reset is not None:
+            try:
+                self.reset(obj)
+            except BaseException:
+                pool.discard(obj)
+                raise
+        pool.release(obj)
+
+
+def pooled(
+    factory: Optional[Callable[[Any], Any]] = None,
+    *,
+    scope: str = "class",
+    reset: Optional[Callable[[Any], Any]] = None,
+    close: Optional[Callable[[Any], Any]] = None,
+    max_size: Optional[int] = None,
+):
+    """
+    Decorate a method of your test-case class that creates an expensive
+    dependency of your `subject`, so that tests borrow an already created
+    object from a pool instead of creating a new one.
+
+    The decorated method is accessed like an attribute. Objects are pooled per
+    test-case class (`scope="class"`), and closed after its tests ran, or shared
+    by all test-case classes of the process (`scope="process"`). `reset` is
+    called with the object after every test that borrowed it, `close` with
+    every pooled object when the pool is cleared, and `max_size` bounds the
+    number of objects, making tests wait for a free one. Pools live in the
+    process, so `max_size` bounds tests run in parallel threads; each process
+    of a multi-process runner has pools of its own.
+
+    Examples:
+        >>> from unittest_extensions import TestCase, args, pooled
+
+        >>> class TestParse(TestCase):
+        ...     @pooled(reset=lambda parser: parser.clear())
+        ...     def parser(self):
+        ...         return Parser()
+
+        ...     def subject(self, text):
+        ...         return self.parser.parse(text)
+
+        ...     @args("1 + 2")
+        ...     def test_sum(self):
+        ...         self.assertResult(3)
+    """
+
+    def pooled_decorator(factory: Callable[[Any], Any]) -> PooledFixture:
+        return PooledFixture(factory, scope, reset, close, max_size)
+
+    if factory is not None:
+        return pooled_decorator(factory)
+    return pooled_decorator
@@ -0,0 +1,325 @@
+"""
+Column-wise comparison of tabular results: pandas DataFrames, pyarrow Tables
+and RecordBatches, lists of records (dicts) and lists of rows (sequences).
+
+pandas, pyarrow and numpy are never imported here; they are used only if the
+compared objects come from them, in which case they are already imported.
+"""
+
+import math
+import sys
+from collections import Counter
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from unittest_extensions.error import TestError
+from unittest_extensions.fingerprint import fingerprint
+
+_Columns = Dict[Any, Sequence]
+
+
+def compare_frames(
+    result: Any,
+    expected: Any,
+    rtol: Optional[float] = None,
+    check_order: bool = True,
+    chunk_size: int = 65536,
+    max_rows: int = 10,
+) -> Optional[str]:
+    """
+    Return a description of how `result` differs from `expected`, or None if
+    they are equal.
+
+    Columns are converted and compared chunk by chunk, with numpy where the
+    columns are numpy arrays, and the comparison stops at the first chunk that
+    differs. Numbers are compared with the relative tolerance `rtol`, if given,
+    and NaNs are equal to each other. If `check_order` is False rows are
+    compared by hashing, which requires them to be exactly equal; rows with
+    unhashable values are compared by their fingerprint, which also tells
+    apart equal numbers of different types. At most `max_rows` differing rows
+    are described.
+    """
+    if not check_order and rtol is not None:
+        raise TestError("Cannot compare frames with rtol when check_order is False")
+    if chunk_size <= 0:
+        raise TestError(f"Invalid chunk_size {chunk_size}; expected a positive int")
+
+    result_frame = _Frame(result)
+    expected_frame = _Frame(expected)
+    if result_frame.names != expected_frame.names:
+        return f"Columns differ: {result_frame.names!r} != {expected_frame.names!r}"
+    if result_frame.length != expected_frame.length:
+        return (
+            "Number of rows differs: "
+            f"{result_frame.length} != {expected_frame.length}"
+        )
+
+    if check_order:
+        return _compare_ordered(
+            result_frame, expected_frame, rtol, chunk_size, max_rows
+        )
+    return _compare_unordered(result_frame, expected_frame, chunk_size, max_rows)
+
+
+def _module(name: str):
+    return sys.modules.get(name)
+
+
+class _Frame:
+    """
+    A frame of any of the supported types, with its column names and number of
+    rows. Its columns are converted a chunk of rows at a time.
+    """
+
+    def __init__(self, frame: Any):
+        self.frame = frame
+        self.kind = self._kind(frame)
+        if self.kind == "pandas":
+            self.names = list(frame.columns)
+            self.length = len(frame)
+        elif self.kind == "pyarrow":
+            self.names = list(frame.column_names)
+            self.length = frame.num_rows
+        elif self.kind == "records":
+            self.names = list(frame[0])
+            self.length = len(frame)
+            self._check_records()
+        elif self.kind == "rows":
+            self.names = list(range(_row_width(0, frame[0])))
+            self.length = len(frame)
+            self._check_rows()
+        else:
+            self.names = []
+            self.length = 0
+
+    @staticmethod
+    def _kind(frame: Any) -> str:
+        pd = _module("pandas")
+        if pd is not None and isinstance(frame, pd.DataFrame):
+            return "pandas"
+        pa = _module("pyarrow")
+        if pa is not None and isinstance(frame, (pa.Table, pa.RecordBatch)):
+            return "pyarrow"
+        if isinstance(frame, (list, tuple)):
+            if len(frame) == 0:
+                return "empty"
+            if isinstance(frame[0], dict):
+                return "records"
+            return "rows"
+        raise TestError(
+            f"Cannot compare {type(frame).__name__} as a frame; expected a pandas "
+            "DataFrame, a pyarrow Table or RecordBatch, or a list of records"
+        )
+
+    def _check_records(self):
+        names = set(self.names)
+        for i, record in enumerate(self.frame):
+            if not isinstance(record, dict) or record.keys() != names:
+                columns = list(record) if isinstance(record, dict) else record
+                raise TestError(
+                    f"Record {i} has columns {columns!r}; expected {self.names!r}"
+                )
+
+    def _check_rows(self):
+        width = len(self.names)
+        for i, row in enumerate(self.frame):
+            if _row_width(i, row) != width:
+                raise TestError(f"Row {i} is {row!r}; expected {width} values")
+
+    def columns(self, start: int, stop: int) -> _Columns:
+        """
+        Return the columns of rows `start` to `stop` (excluded) by name.
+        """
+        if self.kind == "pandas":
+            chunk = self.frame.iloc[start:stop]
+            return {
+                name: chunk.iloc[:, i].to_numpy() for i, name in enumerate(self.names)
+            }
+        if self.kind == "pyarrow":
+            chunk = self.frame.slice(start, stop - start)
+            return {
+                name: chunk.column(i).to_numpy(zero_copy_only=False)
+                for i, name in enumerate(self.names)
+            }
+        rows = self.frame[start:stop]
+        return {name: [row[name] for row in rows] for name in self.names}
+
+    def chunks(self, chunk_size: int) -> Iterator[Tuple[int, int]]:
+        for start in range(0, self.length, chunk_size):
+            yield start, min(start + chunk_size, self.length)
+
+    def row(self, row: int) -> Dict[Any, Any]:
+        columns = self.columns(row, row + 1)
+        return {name: columns[name][0] for name in self.names}
+
+
+def _row_width(i: int, row: Any) -> int:
+    if isinstance(row, (dict, str, bytes)) or not hasattr(row, "__len__"):
+        raise TestError(f"Row {i} is {row!r}; expected a sequence of values")
+    return len(row)
+
+
+def _compare_ordered(
+    result: _Frame,
+    expected: _Frame,
+    rtol: Optional[float],
+    chunk_size: int,
+    max_rows: int,
+) -> Optional[str]:
+    for start, stop in result.chunks(chunk_size):
+        result_columns = result.columns(start, stop)
+        expected_columns = expected.columns(start, stop)
+        differing: Dict[int, List[Any]] = {}
+        for name in result.names:
+            rows = _differing_rows(result_columns[name], expected_columns[name], rtol)
+            for row in rows:
+                differing.setdefault(row, []).append(name)
+        if differing:
+            lines = []
+            for row in sorted(differing)[:max_rows]:
+                for name in differing[row]:
+                    lines.append(
+                        f"  row {start + row}, column {name!r}: "
+                        f"{result_columns[name][row]!r} != "
+                        f"{expected_columns[name][row]!r}"
+                    )
+            return (
+                f"{len(differing)} rows differ in rows {start} to {stop - 1}; "
+                f"first {min(len(differing), max_rows)}:\n" + "\n".join(lines)
+            )
+    return None
+
+
+def _differing_rows(result: Sequence, expected: Sequence, rtol: Optional[float]):
+    np = _module("numpy")
+    if np is not None and (
+        isinstance(result, np.ndarray) or isinstance(expected, np.ndarray)
+    ):
+        return _differing_rows_numpy(np, result, expected, rtol)
+
+    if result == expected:
+        return []
+    return [
+        i
+        for i, (a, b) in enumerate(zip(result, expected))
+        if not _values_equal(a, b, rtol)
+    ]
+
+
+def _differing_rows_numpy(np, result, expected, rtol: Optional[float]):
+    result = np.asarray(result)
+    expected = np.asarray(expected)
+    numeric = result.dtype.kind in "iufc" and expected.dtype.kind in "iufc"
+    if numeric and rtol is not None:
+        equal = np.isclose(result, expected, rtol=rtol, atol=0.0, equal_nan=True)
+    elif numeric:
+        equal = result == expected
+        if result.dtype.kind in "fc" and expected.dtype.kind in "fc":
+            equal |= np.isnan(result) & np.isnan(expected)
+    else:
+        if rtol is None:
+            equal = np.asarray(result == expected, dtype=bool)
+            if equal.all():
+                return []
+        return [
+            i
+            for i, (a, b) in enumerate(zip(result.tolist(), expected.tolist()))
+            if not _values_equal(a, b, rtol)
+        ]
+    return np.flatnonzero(~equal).tolist()
+
+
+def _values_equal(a: Any, b: Any, rtol: Optional[float]) -> bool:
+    try:
+        if a == b:
+            return True
+    except (TypeError, ValueError):
+        pass
+    if isinstance(a, float) and isinstance(b, float) and a != a and b != b:
+        return True
+    if (
+        rtol is not None
+        and isinstance(a, (int, float))
+        and isinstance(b, (int, float))
+        and not isinstance(a, bool)
+        and not isinstance(b, bool)
+    ):
+        return math.isclose(a, b, rel_tol=rtol)
+    return False
+
+
+# Stands for NaN in row keys, since NaN is not equal to itself.
+_NAN = object()
+
+
+def _key_value(value: Any) -> Any:
+    try:
+        if value != value:
+            return _NAN
+    except (TypeError, ValueError):
+        pass
+    return value
+
+
+def _row_keys(frame: _Frame, chunk_size: int, hash_frame: bool) -> Iterator[Any]:
+    """
+    Yield a key per row, equal for equal rows: the vectorized hash of the row
+    if `hash_frame` (for pandas DataFrames with the same dtypes), otherwise the
+    row itself with NaNs made equal, or its fingerprint if the row is
+    unhashable.
+    """
+    for start, stop in frame.chunks(chunk_size):
+        if hash_frame:
+            pd = _module("pandas")
+            chunk = frame.frame.iloc[start:stop]
+            yield from pd.util.hash_pandas_object(chunk, index=False).tolist()
+            continue
+        columns = frame.columns(start, stop)
+        for row in zip(*(columns[name] for name in frame.names)):
+            key = tuple(map(_key_value, row))
+            try:
+                hash(key)
+            except TypeError:
+                yield fingerprint(row)
+            else:
+                yield key
+
+
+def _compare_unordered(
+    result: _Frame, expected: _Frame, chunk_size: int, max_rows: int
+) -> Optional[str]:
+    # The hashes of pandas tell dtypes apart, e.g. 1 from 1.0, which are
+    # equal when compared in order.
+    hash_frames = (
+        result.kind == "pandas"
+        and expected.kind == "pandas"
+        and list(result.frame.dtypes) == list(expected.frame.dtypes)
+    )
+    result_keys = Counter(_row_keys(result, chunk_size, hash_frames))
+    expected_keys = Counter(_row_keys(expected, chunk_size, hash_frames))
+    if result_keys == expected_keys:
+        return None
+    unexpected = result_keys - expected_keys
+    missing = expected_keys - result_keys
+    unexpected_rows = _rows_with(result, unexpected, chunk_size, hash_frames)
+    missing_rows = _rows_with(expected, missing, chunk_size, hash_frames)
+    lines = [
+        f"  unexpected row {row}: {result.row(row)!r}"
+        for row in islice(unexpected_rows, max_rows)
+    ]
+    lines += [
+        f"  missing row {row}: {expected.row(row)!r}"
+        for row in islice(missing_rows, max_rows)
+    ]
+    return (
+        f"{sum(unexpected.values())} unexpected and {sum(missing.values())} "
+        "missing rows, regardless of order:\n" + "\n".join(lines)
+    )
+
+
+def _rows_with(frame: _Frame, keys: Counter, chunk_size: int, hash_frame: bool):
+    remaining = Counter(keys)
+    for row, key in enumerate(_row_keys(frame, chunk_size, hash_frame)):
+        if remaining[key] > 0:
+            remaining[key] -= 1
+            yield row
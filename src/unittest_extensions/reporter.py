@@ -0,0 +1,246 @@
+"""
+Test results that stream one record per test to a file as soon as the test
+finishes, so that the output is usable even if the run is killed midway.
+
+Plug them into the standard runner through its `resultclass`:
+
+    unittest.main(testRunner=unittest.TextTestRunner(resultclass=JSONLinesTestResult))
+
+The output file is read from the `output` class attribute or, if that is not
+set, from an environment variable (`UNITTEST_EXTENSIONS_JSONL` or
+`UNITTEST_EXTENSIONS_JUNIT_XML`).
+"""
+
+import json
+import os
+from abc import ABCMeta, abstractmethod
+import sys
+import traceback
+import unittest
+from time import perf_counter
+from typing import Any, Dict, IO, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from unittest_extensions.case import TestCase
+from unittest_extensions.error import TestError
+
+
+class StreamingTestResult(unittest.TextTestResult, metaclass=ABCMeta):
+    """
+    Extends unittest.TextTestResult to write a record for every finished test
+    to `output`, flushing after each record. A test whose subtests fail is
+    recorded with the outcome of its first failing subtest.
+
+    Subclasses define `_writeHeader`, `_writeRecord` and `_writeFooter`.
+    """
+
+    output: Optional[str] = None
+    outputEnvironmentVariable: Optional[str] = None
+
+    def __init__(self, stream, descriptions, verbosity, **kwargs) -> None:
+        super().__init__(stream, descriptions, verbosity, **kwargs)
+        self._outputFile: Optional[IO[str]] = None
+        self._testStart = 0.0
+        self._currentTest: Any = None
+        self._pendingRecord: Optional[Tuple[str, Any, Optional[str]]] = None
+
+    def _openOutput(self) -> IO[str]:
+        if self._outputFile is None:
+            path = self.output
+            if path is None and self.outputEnvironmentVariable is not None:
+                path = os.environ.get(self.outputEnvironmentVariable)
+            if path is None:
+                raise TestError(
+                    f"No output file for {type(self).__name__}; set its 'output' "
+                    f"attribute or the {self.outputEnvironmentVariable} "
+                    "environment variable"
+                )
+            self._outputFile = open(path, "w", encoding="utf-8")
+            self._writeHeader(self._outputFile)
+            self._outputFile.flush()
+        return self._outputFile
+
+    def startTestRun(self):
+        super().startTestRun()
+        self._openOutput()
+
+    def stopTestRun(self):
+        super().stopTestRun()
+        if self._outputFile is not None:
+            self._writeFooter(self._outputFile)
+            self._outputFile.close()
+            self._outputFile = None
+
+    def startTest(self, test):
+        super().startTest(test)
+        self._testStart = perf_counter()
+        self._currentTest = test
+        self._pendingRecord = None
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        if self._pendingRecord is not None:
+            duration = perf_counter() - self._testStart
+            self._record(test, duration, *self._pendingRecord)
+        self._currentTest = None
+        self._pendingRecord = None
+
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        self._outcome(test, "success")
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self._outcome(test, "failure", err)
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        self._outcome(test, "error", err)
+
+    def addSubTest(self, test, subtest, err):
+        super().addSubTest(test, subtest, err)
+        if err is not None:
+            outcome = (
+                "failure" if issubclass(err[0], test.failureException) else "error"
+            )
+            self._outcome(test, outcome, err)
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self._outcome(test, "skipped", message=reason)
+
+    def addExpectedFailure(self, test, err):
+        super().addExpectedFailure(test, err)
+        self._outcome(test, "expected_failure")
+
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test)
+        self._outcome(test, "unexpected_success")
+
+    def _outcome(self, test, outcome: str, err=None, message: Optional[str] = None):
+        # Errors of class and module fixtures are reported outside of
+        # startTest/stopTest, so they are recorded right away, with no duration
+        # of their own.
+        if test is not self._currentTest:
+            self._record(test, 0.0, outcome, err, message)
+        elif self._pendingRecord is None:
+            self._pendingRecord = (outcome, err, message)
+
+    def _record(
+        self,
+        test,
+        duration: float,
+        outcome: str,
+        err=None,
+        message: Optional[str] = None,
+    ):
+        record: Dict[str, Any] = {
+            "id": test.id(),
+            "outcome": outcome,
+            "duration": duration,
+        }
+        if err is not None:
+            record["message"] = "".join(
+                traceback.format_exception_only(err[0], err[1])
+            ).strip()
+            record["traceback"] = "".join(traceback.format_exception(*err))
+        elif message is not None:
+            record["message"] = message
+        record.update(_subject_metrics(test))
+        output = self._openOutput()
+        self._writeRecord(output, record)
+        output.flush()
+
+    def _writeHeader(self, output: IO[str]):
+        pass
+
+    @abstractmethod
+    def _writeRecord(self, output: IO[str], record: Dict[str, Any]):
+        pass
+
+    def _writeFooter(self, output: IO[str]):
+        pass
+
+
+class JSONLinesTestResult(StreamingTestResult):
+    """
+    Write one JSON object per test, and per line, to `output`.
+
+    Each object has the test `id`, `outcome` and `duration` (0.0 for errors of
+    class and module fixtures) and, for tests of
+    `unittest_extensions.TestCase`, the `args` and `kwargs` of the subject (as
+    their `repr`), the `subject_duration` of the last subject call and the
+    shallow `result_size` of its result in bytes.
+    """
+
+    outputEnvironmentVariable = "UNITTEST_EXTENSIONS_JSONL"
+
+    def _writeRecord(self, output: IO[str], record: Dict[str, Any]):
+        output.write(json.dumps(record) + "\n")
+
+
+class JUnitXMLTestResult(StreamingTestResult):
+    """
+    Write a JUnit XML `testsuite` to `output`, one `testcase` element at a time.
+
+    The subject metrics of `JSONLinesTestResult` are written as `properties` of
+    each `testcase`. If the run is killed midway, the file is only missing its
+    closing tag.
+    """
+
+    outputEnvironmentVariable = "UNITTEST_EXTENSIONS_JUNIT_XML"
+
+    def _writeHeader(self, output: IO[str]):
+        output.write('<?xml version="1.0" encoding="utf-8"?>\n')
+        output.write('<testsuite name="unittest">\n')
+
+    def _writeRecord(self, output: IO[str], record: Dict[str, Any]):
+        classname, _, name = record["id"].rpartition(".")
+        output.write(
+            f"  <testcase classname={quoteattr(classname)} name={quoteattr(name)} "
+            f'time="{record["duration"]:.6f}">\n'
+        )
+        properties = {
+            key: record[key]
+            for key in ("args", "kwargs", "subject_duration", "result_size")
+            if key in record
+        }
+        if properties:
+            output.write("    <properties>\n")
+            for key, value in properties.items():
+                output.write(
+                    f"      <property name={quoteattr(key)} "
+                    f"value={quoteattr(str(value))}/>\n"
+                )
+            output.write("    </properties>\n")
+        outcome = record["outcome"]
+        message = quoteattr(record.get("message", ""))
+        if outcome in ("failure", "error"):
+            output.write(
+                f"    <{outcome} message={message}>"
+                f"{escape(record['traceback'])}</{outcome}>\n"
+            )
+        elif outcome == "skipped":
+            output.write(f"    <skipped message={message}/>\n")
+        output.write("  </testcase>\n")
+
+    def _writeFooter(self, output: IO[str]):
+        output.write("</testsuite>\n")
+
+
+def _subject_metrics(test) -> Dict[str, Any]:
+    if not isinstance(test, TestCase):
+        return {}
+    method = getattr(test, test._testMethodName, None)
+    metrics: Dict[str, Any] = {
+        "args": [repr(arg) for arg in getattr(method, "_subjectArgs", ())],
+        "kwargs": {
+            key: repr(value)
+            for key, value in getattr(method, "_subjectKwargs", {}).items()
+        },
+    }
+    if hasattr(test, "_subjectDuration"):
+        metrics["subject_duration"] = test._subjectDuration
+    if hasattr(test, "_subjectResult"):
+        metrics["result_size"] = sys.getsizeof(test._subjectResult)
+    return metrics
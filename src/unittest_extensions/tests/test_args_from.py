@@ -0,0 +1,151 @@
+import os
+import tempfile
+import unittest
+from io import StringIO
+from time import perf_counter
+
+from unittest_extensions import TestCase, args, args_from
+from unittest_extensions.decorator import _candidates, _ExampleCache, _shrink
+
+
+class TestArgsFrom(TestCase):
+    class Generated(TestCase):
+        examples = []
+
+        def subject(self, x, y=0):
+            TestArgsFrom.Generated.examples.append((x, y))
+            return x + y
+
+        @args_from(lambda rng: rng.randint(0, 1000), max_examples=50, seed=1)
+        def test_passes(self):
+            self.assertResultGreaterEqual(0)
+
+        @args_from(lambda rng: rng.randint(0, 1000), seed=1)
+        def test_fails(self):
+            self.assertResultLess(100)
+
+        @args_from(lambda rng: {"x": rng.random(), "y": rng.random()}, seed=1)
+        def test_keyword_arguments(self):
+            self.assertResultLess(2)
+
+        @args_from(lambda rng: (rng.randint(1, 10), rng.randint(1, 10)), seed=1)
+        def test_error(self):
+            self.result()
+            raise KeyError("boom")
+
+        @args_from(lambda rng: rng.random(), max_examples=10**9, time_budget=0.05)
+        def test_time_budget(self):
+            self.assertResultLess(1)
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        previous = os.environ.get("UNITTEST_EXTENSIONS_EXAMPLES")
+        os.environ["UNITTEST_EXTENSIONS_EXAMPLES"] = directory.name
+        if previous is None:
+            self.addCleanup(os.environ.pop, "UNITTEST_EXTENSIONS_EXAMPLES")
+        else:
+            self.addCleanup(
+                os.environ.__setitem__, "UNITTEST_EXTENSIONS_EXAMPLES", previous
+            )
+        self.Generated.examples = []
+
+    def subject(self, name):
+        runner = unittest.TextTestRunner(stream=StringIO())
+        return runner.run(self.Generated(name))
+
+    @args("test_passes")
+    def test_runs_max_examples(self):
+        self.assertTrue(self.result().wasSuccessful())
+        self.assertEqual(len(self.Generated.examples), 50)
+
+    @args("test_fails")
+    def test_shrinks_failure(self):
+        [(_, message)] = self.result().failures
+        self.assertIn("Falsifying example: args=(100,), kwargs={}", message)
+
+    @args("test_keyword_arguments")
+    def test_keyword_arguments_pass(self):
+        self.assertTrue(self.result().wasSuccessful())
+
+    @args("test_error")
+    def test_shrinks_error(self):
+        [(_, message)] = self.result().errors
+        self.assertIn("KeyError: 'boom'\nFalsifying example: args=(0, 0)", message)
+
+    @args("test_fails")
+    def test_replays_cached_failure_first(self):
+        self.result()
+        self.Generated.examples.clear()
+        self.result()
+        self.assertEqual(self.Generated.examples[0], (100, 0))
+
+    @args("test_time_budget")
+    def test_stops_at_time_budget(self):
+        self.assertTrue(self.result().wasSuccessful())
+
+    @args("test_passes")
+    def test_corrupt_cache_cleared(self):
+        cache = _ExampleCache(self.Generated("test_passes").id())
+        os.makedirs(os.path.dirname(cache.path), exist_ok=True)
+        with open(cache.path, "wb") as f:
+            f.write(b"not a pickle")
+        self.assertTrue(self.result().wasSuccessful())
+        self.assertFalse(cache.exists())
+
+
+class TestCandidates(TestCase):
+    def subject(self, value):
+        return list(_candidates(value))
+
+    @args(10)
+    def test_int(self):
+        self.assertResult([0, 5, 9])
+
+    @args(-3)
+    def test_negative_int(self):
+        self.assertResult([0, -1, -2, 3])
+
+    @args(10**400 + 1)
+    def test_big_int(self):
+        self.assertResult([0, 5 * 10**399, 10**400])
+
+    @args(-(10**400) - 1)
+    def test_big_negative_int(self):
+        self.assertResult([0, -5 * 10**399, -(10**400), 10**400 + 1])
+
+    @args(1.5)
+    def test_float(self):
+        self.assertResult([0.0, 1.0, 0.75])
+
+    @args("ab")
+    def test_str(self):
+        self.assertResult(["", "a", "b", "b", "a"])
+
+    @args([True])
+    def test_list(self):
+        self.assertResult([[], [False]])
+
+    @args({"a": 1})
+    def test_dict(self):
+        self.assertResult([{}, {"a": 0}])
+
+
+class TestShrink(TestCase):
+    def subject(self, deadline):
+        runs = []
+
+        def run(example):
+            runs.append(example)
+            return ValueError(example)
+
+        example, _ = _shrink(run, 1000, ValueError(1000), deadline)
+        return example, len(runs)
+
+    @args(None)
+    def test_shrinks_without_deadline(self):
+        self.assertResult((0, 1))
+
+    @args(perf_counter() - 1)
+    def test_stops_at_deadline(self):
+        self.assertResult((1000, 0))
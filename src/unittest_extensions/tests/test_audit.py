@@ -0,0 +1,91 @@
+import os
+import pathlib
+import socket
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+from unittest_extensions import TestCase, args
+from unittest_extensions.audit import record_io
+
+
+class TestAssertResultIOBelow(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "config")
+        with open(self.path, "w") as f:
+            f.write("x" * 1000)
+
+    def subject(self, times):
+        for _ in range(times):
+            with open(self.path) as f:
+                f.read()
+
+    @args(2)
+    def test_opens_within_budget(self):
+        self.assertResultIOBelow(opens=2)
+
+    @args(3)
+    def test_opens_over_budget_fails(self):
+        with self.assertRaisesRegex(AssertionError, "opens=3 \\(budget 2\\)"):
+            self.assertResultIOBelow(opens=2)
+
+    @args(3)
+    def test_failure_reports_call_sites(self):
+        with self.assertRaisesRegex(AssertionError, "test_audit.py:\\d+ in subject"):
+            self.assertResultIOBelow(opens=0)
+
+    @unittest.skipUnless(os.path.exists("/proc/self/io"), "requires /proc/self/io")
+    @args(2)
+    def test_bytes_read_over_budget_fails(self):
+        with self.assertRaisesRegex(AssertionError, "bytes_read=2000"):
+            self.assertResultIOBelow(bytes_read=1000)
+
+    @args(0)
+    def test_no_budget(self):
+        self.assertResultIOBelow()
+
+
+class TestRecordIOConnections(TestCase):
+    def subject(self, connect):
+        with record_io() as usage:
+            connect()
+        return usage.connections, usage.sockets
+
+    @unittest.skipIf(sys.version_info < (3, 10), "sqlite3.connect is audited >= 3.10")
+    @args(lambda: sqlite3.connect(":memory:").close())
+    def test_sqlite3(self):
+        self.assertResult((1, 0))
+
+    @args(lambda: socket.socket().close())
+    def test_unconnected_socket(self):
+        self.assertResult((0, 1))
+
+
+class TestRecordIOCallSite(TestCase):
+    def subject(self, call):
+        with record_io() as usage:
+            call()
+        [(_, _, site)] = usage.calls
+        return site
+
+    @args(lambda: pathlib.Path(__file__).read_text())
+    def test_pathlib_reports_caller(self):
+        self.assertResultRegex("test_audit.py:\\d+ in <lambda>$")
+
+    @args(lambda: socket.socket().close())
+    def test_socket_reports_caller(self):
+        self.assertResultRegex("test_audit.py:\\d+ in <lambda>$")
+
+
+class TestRecordIOOutside(TestCase):
+    def subject(self):
+        with record_io() as usage:
+            pass
+        open(__file__).close()
+        return usage.opens
+
+    def test_not_recorded_after_block(self):
+        self.assertResult(0)
@@ -0,0 +1,132 @@
+import threading
+from array import array
+
+from unittest_extensions import TestCase, args
+from unittest_extensions.fingerprint import fingerprint
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class Locked:
+    def __init__(self, value):
+        self.lock = threading.Lock()
+        self.value = value
+
+
+class SlottedPoint:
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def churn(strings):
+    # Changes the iteration order of the set but not its contents.
+    extra = [str(i) for i in range(4000)]
+    strings.update(extra)
+    strings.difference_update(extra)
+    strings.update(extra[:1])
+    strings.discard(extra[0])
+
+
+class TestFingerprintEqual(TestCase):
+    def subject(self, make):
+        return fingerprint(make()) == fingerprint(make())
+
+    @args(lambda: [1, "a", b"b", 2.5, None, (True,)])
+    def test_builtins(self):
+        self.assertResultTrue()
+
+    @args(lambda: {"a": {1, 2}, "b": frozenset({"x"})})
+    def test_dicts_and_sets(self):
+        self.assertResultTrue()
+
+    @args(lambda: array("d", range(1000)))
+    def test_array(self):
+        self.assertResultTrue()
+
+    @args(lambda: Point(1, [2]))
+    def test_object(self):
+        self.assertResultTrue()
+
+    @args(lambda: SlottedPoint(1, [2]))
+    def test_slotted_object(self):
+        self.assertResultTrue()
+
+    @args(lambda: [len, Point, threading])
+    def test_functions_classes_and_modules(self):
+        self.assertResultTrue()
+
+
+class TestFingerprintMutated(TestCase):
+    def subject(self, obj, mutate):
+        before = fingerprint(obj)
+        mutate(obj)
+        return fingerprint(obj) == before
+
+    @args([1, [2]], lambda lst: lst[1].append(3))
+    def test_nested_list(self):
+        self.assertResultFalse()
+
+    @args({"a": 1}, lambda dct: dct.update(a=2))
+    def test_dict(self):
+        self.assertResultFalse()
+
+    @args(bytearray(b"abc"), lambda buffer: buffer.__setitem__(0, 0))
+    def test_bytearray(self):
+        self.assertResultFalse()
+
+    @args(array("i", [1, 2]), lambda arr: arr.__setitem__(1, 3))
+    def test_array(self):
+        self.assertResultFalse()
+
+    @args(Point(1, 2), lambda point: setattr(point, "y", 3))
+    def test_object(self):
+        self.assertResultFalse()
+
+    @args(SlottedPoint(1, 2), lambda point: setattr(point, "y", 3))
+    def test_slotted_object(self):
+        self.assertResultFalse()
+
+    @args([1], lambda lst: lst.append(lst))
+    def test_cyclic_list(self):
+        self.assertResultFalse()
+
+    @args([bytearray(b"abc")], lambda lst: lst[0].__setitem__(0, 0))
+    def test_nested_bytearray(self):
+        self.assertResultFalse()
+
+    @args({"a": array("d", [1.0])}, lambda dct: dct["a"].append(2.0))
+    def test_nested_array(self):
+        self.assertResultFalse()
+
+    @args(Locked([1]), lambda locked: locked.value.append(2))
+    def test_unpicklable_object(self):
+        self.assertResultFalse()
+
+    @args({"a", "b", "c", "d"}, lambda strings: strings.add("e"))
+    def test_set(self):
+        self.assertResultFalse()
+
+    @args([{"x", "y"}, 1], lambda lst: lst[0].discard("x"))
+    def test_nested_set(self):
+        self.assertResultFalse()
+
+
+class TestFingerprintSetOrder(TestCase):
+    def subject(self, strings):
+        reordered = set(strings)
+        churn(reordered)
+        return (
+            list(reordered) != list(strings),
+            fingerprint(reordered) == fingerprint(strings),
+        )
+
+    @args({f"item {i}" for i in range(50)})
+    def test_equal_set_in_different_order(self):
+        self.assertResult((True, True))
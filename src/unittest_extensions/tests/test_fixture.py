@@ -0,0 +1,113 @@
+import threading
+import unittest
+from io import StringIO
+
+from unittest_extensions import TestCase, args, pooled
+from unittest_extensions.error import TestError
+from unittest_extensions.fixture import _Pool
+
+
+class Dependency:
+    created = 0
+    instances = []
+
+    def __init__(self):
+        Dependency.created += 1
+        Dependency.instances.append(self)
+        self.calls = []
+        self.closed = False
+
+    def call(self, a):
+        self.calls.append(a)
+        return len(self.calls)
+
+    def close(self):
+        self.closed = True
+
+
+def reset(dependency):
+    TestPooled.Pooled.resets += 1
+    dependency.calls.clear()
+
+
+class TestPooled(TestCase):
+    class Pooled(TestCase):
+        resets = 0
+
+        @pooled(reset=reset, close=Dependency.close)
+        def dependency(self):
+            return Dependency()
+
+        def subject(self, a):
+            return self.dependency.call(a)
+
+        @args(1)
+        def test_first(self):
+            self.assertResult(1)
+            self.assertResult(2)
+
+        @args(2)
+        def test_second(self):
+            self.assertResult(1)
+            self.assertIs(self.dependency, self.dependency)
+
+    def setUp(self):
+        Dependency.created = 0
+        Dependency.instances = []
+        self.Pooled.resets = 0
+
+    def subject(self):
+        suite = unittest.defaultTestLoader.loadTestsFromTestCase(self.Pooled)
+        return unittest.TextTestRunner(stream=StringIO()).run(suite)
+
+    def test_tests_pass(self):
+        self.assertTrue(self.result().wasSuccessful())
+
+    def test_dependency_created_once(self):
+        self.result()
+        self.assertEqual(Dependency.created, 1)
+
+    def test_dependency_reset_after_each_test(self):
+        self.result()
+        self.assertEqual(self.Pooled.resets, 2)
+
+    def test_dependency_closed_after_each_run(self):
+        self.result()
+        self.result()
+        self.assertEqual(Dependency.created, 2)
+        self.assertTrue(all(dependency.closed for dependency in Dependency.instances))
+
+
+class TestPooledInvalidScope(TestCase):
+    def subject(self, scope):
+        return pooled(scope=scope)(lambda self: None)
+
+    @args("module")
+    def test_invalid_scope_raises(self):
+        self.assertResultRaises(TestError)
+
+    @args("process")
+    def test_process_scope(self):
+        self.assertResultNotRaises()
+
+
+class TestPoolMaxSize(TestCase):
+    def subject(self, max_size):
+        pool = _Pool(max_size)
+        first = pool.acquire(object)
+        acquired = []
+        thread = threading.Thread(target=lambda: acquired.append(pool.acquire(object)))
+        thread.start()
+        thread.join(0.1)
+        waited = thread.is_alive()
+        pool.release(first)
+        thread.join()
+        return waited, acquired[0] is first
+
+    @args(1)
+    def test_waits_for_free_object(self):
+        self.assertResult((True, True))
+
+    @args(None)
+    def test_unbounded_does_not_wait(self):
+        self.assertResult((False, False))
@@ -0,0 +1,189 @@
+import unittest
+
+from unittest_extensions import TestCase, args
+from unittest_extensions.error import TestError
+from unittest_extensions.frame import _differing_rows
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+def reordered(strings):
+    # An equal set whose iteration order differs.
+    strings = set(strings)
+    extra = [str(i) for i in range(4000)]
+    strings.update(extra)
+    strings.difference_update(extra)
+    return strings
+
+
+class TestAssertResultFrameRecords(TestCase):
+    def subject(self, records):
+        return records
+
+    @args([{"a": 1, "b": "x"}, {"a": 2, "b": "y"}])
+    def test_equal(self):
+        self.assertResultFrame([{"a": 1, "b": "x"}, {"a": 2, "b": "y"}])
+
+    @args([(1, "x"), (2, "y")])
+    def test_equal_rows(self):
+        self.assertResultFrame([(1, "x"), (2, "y")])
+
+    @args([{"a": 1.0}, {"a": float("nan")}])
+    def test_nan_equal(self):
+        self.assertResultFrame([{"a": 1.0}, {"a": float("nan")}])
+
+    @args([{"a": 1.0000001}])
+    def test_rtol(self):
+        self.assertResultFrame([{"a": 1.0}], rtol=1e-6)
+
+    @args([{"a": 1.0001}])
+    def test_rtol_exceeded_fails(self):
+        with self.assertRaisesRegex(AssertionError, "row 0, column 'a'"):
+            self.assertResultFrame([{"a": 1.0}], rtol=1e-6)
+
+    @args([{"a": 1, "b": 2}])
+    def test_different_columns_fails(self):
+        with self.assertRaisesRegex(AssertionError, "Columns differ"):
+            self.assertResultFrame([{"a": 1}])
+
+    @args([{"a": 1}])
+    def test_different_length_fails(self):
+        with self.assertRaisesRegex(AssertionError, "Number of rows differs: 1 != 2"):
+            self.assertResultFrame([{"a": 1}, {"a": 2}])
+
+    @args([{"a": i} for i in range(100)])
+    def test_reports_first_failing_chunk(self):
+        expected = [{"a": -1 if i in (30, 35, 90) else i} for i in range(100)]
+        with self.assertRaisesRegex(
+            AssertionError, "2 rows differ in rows 20 to 39; first 2"
+        ):
+            self.assertResultFrame(expected, chunk_size=20)
+
+    @args([{"a": 1, "b": [1]}, {"a": 2, "b": [2]}])
+    def test_unordered(self):
+        self.assertResultFrame(
+            [{"a": 2, "b": [2]}, {"a": 1, "b": [1]}], check_order=False
+        )
+
+    @args([{"a": 1}, {"a": 1}, {"a": 2}])
+    def test_unordered_counts_duplicates(self):
+        with self.assertRaisesRegex(AssertionError, "1 unexpected and 1 missing rows"):
+            self.assertResultFrame([{"a": 1}, {"a": 2}, {"a": 2}], check_order=False)
+
+    @args([{"k": 1, "s": {f"item {i}" for i in range(50)}}])
+    def test_unordered_sets_in_different_order(self):
+        expected = [{"k": 1, "s": reordered(self.result()[0]["s"])}]
+        self.assertResultFrame(expected, check_order=False)
+
+    @args([{"a": 1.0}, {"a": float("nan")}])
+    def test_unordered_nan_equal(self):
+        self.assertResultFrame([{"a": float("nan")}, {"a": 1.0}], check_order=False)
+
+    @args([{"a": 1}, {"a": 2}])
+    def test_unordered_int_equal_to_float(self):
+        self.assertResultFrame([{"a": 2.0}, {"a": 1.0}], check_order=False)
+
+    @args([{"a": 1}])
+    def test_unordered_rtol_raises(self):
+        with self.assertRaises(TestError):
+            self.assertResultFrame([{"a": 1}], rtol=0.1, check_order=False)
+
+    @args(1)
+    def test_not_a_frame_raises(self):
+        with self.assertRaises(TestError):
+            self.assertResultFrame([{"a": 1}])
+
+    @args([{"a": 1, "b": 2}, {"a": 2}])
+    def test_record_missing_column_raises(self):
+        with self.assertRaisesRegex(TestError, "Record 1 has columns \\['a'\\]"):
+            self.assertResultFrame([{"a": 1, "b": 2}, {"a": 2, "b": 3}])
+
+    @args([{"a": 1}, {"a": 2, "b": 3}])
+    def test_record_extra_column_raises(self):
+        with self.assertRaisesRegex(TestError, "Record 1 has columns"):
+            self.assertResultFrame([{"a": 1}, {"a": 2}])
+
+    @args([(1, "x"), (2,)])
+    def test_short_row_raises(self):
+        with self.assertRaisesRegex(TestError, "Row 1 is \\(2,\\); expected 2 values"):
+            self.assertResultFrame([(1, "x"), (2, "y")])
+
+    @args([{"a": 1}])
+    def test_invalid_chunk_size_raises(self):
+        with self.assertRaisesRegex(TestError, "chunk_size 0"):
+            self.assertResultFrame([{"a": 1}], chunk_size=0)
+
+    @args([{"a": i % 7} for i in range(50)])
+    def test_unordered_chunks(self):
+        expected = [{"a": i % 7} for i in reversed(range(50))]
+        self.assertResultFrame(expected, check_order=False, chunk_size=8)
+
+
+@unittest.skipIf(pd is None, "requires pandas")
+class TestAssertResultFramePandas(TestCase):
+    def subject(self, n):
+        return pd.DataFrame({"a": range(n), "b": [i / 3 for i in range(n)]})
+
+    @args(1000)
+    def test_equal(self):
+        self.assertResultFrame(
+            pd.DataFrame({"a": range(1000), "b": [i / 3 for i in range(1000)]}),
+            chunk_size=100,
+        )
+
+    @args(3)
+    def test_equal_records(self):
+        self.assertResultFrame([{"a": i, "b": i / 3} for i in range(3)], rtol=1e-9)
+
+    @args(1000)
+    def test_differs_fails(self):
+        expected = pd.DataFrame({"a": range(1000), "b": [i / 3 for i in range(1000)]})
+        expected.loc[500, "b"] = 0.0
+        with self.assertRaisesRegex(AssertionError, "row 500, column 'b'"):
+            self.assertResultFrame(expected, chunk_size=100)
+
+    @args(1000)
+    def test_unordered(self):
+        expected = pd.DataFrame({"a": range(1000), "b": [i / 3 for i in range(1000)]})
+        self.assertResultFrame(expected.iloc[::-1], check_order=False)
+
+    @args(10)
+    def test_unordered_int_equal_to_float(self):
+        expected = pd.DataFrame(
+            {"a": [float(i) for i in range(10)], "b": [i / 3 for i in range(10)]}
+        )
+        self.assertResultFrame(expected.iloc[::-1], check_order=False)
+
+
+@unittest.skipIf(np is None, "requires numpy")
+class TestDifferingRowsNumpy(TestCase):
+    def subject(self, result, expected, rtol=None):
+        return _differing_rows(np.asarray(result), np.asarray(expected), rtol)
+
+    @args([1, 2, 3], [1.0, 2.0, 3.0])
+    def test_int_equal_to_float(self):
+        self.assertResult([])
+
+    @args([1.0, float("nan"), 3.0], [1.0, float("nan"), 4.0])
+    def test_nan_equal(self):
+        self.assertResult([2])
+
+    @args([1.0, 2.0000001, 3.1], [1.0, 2.0, 3.0], rtol=1e-6)
+    def test_rtol(self):
+        self.assertResult([2])
+
+    @args(["a", "b", "c"], ["a", "x", "c"])
+    def test_strings(self):
+        self.assertResult([1])
+
+    @args([1, None, "x"], [1.0, None, "y"], rtol=0.1)
+    def test_objects_with_rtol(self):
+        self.assertResult([2])
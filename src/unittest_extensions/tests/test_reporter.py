@@ -0,0 +1,98 @@
+import json
+import os
+import tempfile
+import unittest
+from io import StringIO
+from xml.etree import ElementTree
+
+from unittest_extensions import TestCase, args
+from unittest_extensions.error import TestError
+from unittest_extensions.reporter import JSONLinesTestResult, JUnitXMLTestResult
+
+
+class TestStreamingTestResult(TestCase):
+    class Reported(TestCase):
+        def subject(self, a, b):
+            return [a] * b
+
+        @args(1, b=3)
+        def test_success(self):
+            self.assertResult([1, 1, 1])
+
+        @args("a", b=1)
+        def test_failure(self):
+            self.assertResult(["b"])
+
+        def test_error(self):
+            self.assertResult([])
+
+        def test_subtest_failure(self):
+            for i in range(3):
+                with self.subTest(i=i):
+                    self.assertLess(i, 1)
+
+        @unittest.skip("skipped")
+        def test_skipped(self):
+            pass
+
+    class FixtureError(TestCase):
+        @classmethod
+        def setUpClass(cls):
+            raise ValueError("setUpClass failed")
+
+        def test_never_run(self):
+            pass
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.output = os.path.join(directory.name, "results")
+
+    def subject(self, resultclass, reported=None):
+        resultclass = type("Result", (resultclass,), {"output": self.output})
+        runner = unittest.TextTestRunner(stream=StringIO(), resultclass=resultclass)
+        reported = reported or self.Reported
+        runner.run(unittest.defaultTestLoader.loadTestsFromTestCase(reported))
+        with open(self.output) as f:
+            return f.read()
+
+    @args(JSONLinesTestResult)
+    def test_json_lines(self):
+        records = {
+            record["id"].rpartition(".")[2]: record
+            for record in map(json.loads, self.result().splitlines())
+        }
+        self.assertEqual(records["test_success"]["outcome"], "success")
+        self.assertEqual(records["test_success"]["args"], ["1"])
+        self.assertEqual(records["test_success"]["kwargs"], {"b": "3"})
+        self.assertIn("subject_duration", records["test_success"])
+        self.assertIn("result_size", records["test_success"])
+        self.assertEqual(records["test_failure"]["outcome"], "failure")
+        self.assertEqual(records["test_error"]["outcome"], "error")
+        self.assertEqual(records["test_skipped"]["outcome"], "skipped")
+        self.assertEqual(records["test_subtest_failure"]["outcome"], "failure")
+
+    @args(JSONLinesTestResult, FixtureError)
+    def test_class_fixture_error(self):
+        [record] = map(json.loads, self.result().splitlines())
+        self.assertIn("setUpClass", record["id"])
+        self.assertEqual(record["outcome"], "error")
+        self.assertEqual(record["duration"], 0.0)
+
+    @args(JUnitXMLTestResult)
+    def test_junit_xml(self):
+        suite = ElementTree.fromstring(self.result())
+        self.assertEqual(len(suite.findall("testcase")), 5)
+        self.assertEqual(len(suite.findall("testcase/failure")), 2)
+        self.assertEqual(len(suite.findall("testcase/error")), 1)
+        self.assertEqual(len(suite.findall("testcase/skipped")), 1)
+
+    @args(JSONLinesTestResult)
+    def test_missing_output_raises(self):
+        self.output = None
+        previous = os.environ.pop("UNITTEST_EXTENSIONS_JSONL", None)
+        if previous is not None:
+            self.addCleanup(
+                os.environ.__setitem__, "UNITTEST_EXTENSIONS_JSONL", previous
+            )
+        self.assertResultRaises(TestError)
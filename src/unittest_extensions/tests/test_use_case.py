@@ -1,5 +1,28 @@
-from unittest_extensions import TestCase, args
+import signal
+import threading
+import time
+import unittest
+from io import StringIO
+
+from unittest_extensions import TestCase, args, timeout
 from unittest_extensions.error import TestError
+from unittest_extensions.watchdog import _watchdog
+
+
+def setUpModule():
+    # Keeps the stacks the watchdog writes on timeouts out of the test output.
+    global _watchdogStream
+    _watchdogStream, _watchdog.stream = _watchdog.stream, StringIO()
+
+
+def tearDownModule():
+    _watchdog.stream = _watchdogStream
+
+
+def deadlock():
+    lock = threading.Lock()
+    lock.acquire()
+    lock.acquire()
 
 
 class TestClass:
@@ -416,3 +439,139 @@ class TestAssertResultNotRaises(TestCase):
     @args(r=True)
     def test_raises(self):
         self.assertResultRaises(KeyError)
+
+
+class TestCheckSubjectArgsMutation(TestCase):
+    checkSubjectArgsMutation = True
+
+    def subject(self, lst, a, mutate=True):
+        if mutate:
+            lst.append(a)
+        return len(lst)
+
+    @args([1], 2)
+    def test_args_mutated_fails(self):
+        with self.assertRaisesRegex(
+            AssertionError, "Subject mutated its positional argument 0"
+        ):
+            self.result()
+
+    @args(lst=[1], a=2)
+    def test_kwargs_mutated_fails(self):
+        with self.assertRaisesRegex(AssertionError, "Subject mutated its 'lst'"):
+            self.result()
+
+    @args([1], 2, mutate=False)
+    def test_not_mutated(self):
+        self.assertResult(1)
+
+
+class TestSubjectTimeout(TestCase):
+    subjectTimeout = 0.05
+
+    def subject(self, seconds):
+        time.sleep(seconds)
+        return seconds
+
+    @args(0)
+    def test_completes(self):
+        self.assertResult(0)
+
+    @args(0.2)
+    def test_hangs_fails(self):
+        with self.assertRaisesRegex(
+            AssertionError, "Subject did not complete within 0.05 seconds"
+        ):
+            self.result()
+
+    @args(0.2)
+    def test_failure_reports_subject_stack(self):
+        with self.assertRaisesRegex(AssertionError, "in subject"):
+            self.result()
+
+    @timeout(1)
+    @args(0.1)
+    def test_timeout_decorator(self):
+        self.assertResult(0.1)
+
+    @args(0.1)
+    @timeout(1)
+    def test_timeout_decorator_below_args(self):
+        self.assertResult(0.1)
+
+    @args(ValueError)
+    def test_reraises_subject_error(self):
+        self.assertResultRaises(TypeError)
+
+
+class TestAssertResultCompletesWithin(TestCase):
+    def subject(self, seconds):
+        time.sleep(seconds)
+
+    @args(0)
+    def test_completes(self):
+        self.assertResultCompletesWithin(1)
+
+    @args(0.2)
+    def test_hangs_fails(self):
+        with self.assertRaises(AssertionError):
+            self.assertResultCompletesWithin(0.05)
+
+
+class TestSubjectTimeoutThread(TestCase):
+    subjectTimeout = 5
+
+    def subject(self):
+        return threading.get_ident()
+
+    def test_subject_runs_on_calling_thread(self):
+        self.assertResult(threading.get_ident())
+
+
+class TestSubjectTimeoutInterrupt(TestCase):
+    subjectTimeout = 0.05
+
+    def subject(self):
+        while True:
+            try:
+                time.sleep(0.01)
+            except Exception:
+                pass
+
+    def test_busy_subject_is_interrupted(self):
+        start = time.perf_counter()
+        with self.assertRaisesRegex(AssertionError, "in subject"):
+            self.result()
+        self.assertLess(time.perf_counter() - start, 1)
+
+
+@unittest.skipUnless(hasattr(signal, "pthread_kill"), "requires pthread_kill")
+class TestSubjectTimeoutBlocked(TestCase):
+    subjectTimeout = 0.05
+
+    def setUp(self):
+        self.stream = StringIO()
+        previous, _watchdog.stream = _watchdog.stream, self.stream
+        self.addCleanup(setattr, _watchdog, "stream", previous)
+
+    def subject(self, block):
+        block()
+
+    @args(lambda: threading.Event().wait())
+    def test_event_wait_is_interrupted(self):
+        start = time.perf_counter()
+        with self.assertRaisesRegex(AssertionError, "in subject"):
+            self.result()
+        self.assertLess(time.perf_counter() - start, 1)
+
+    @args(deadlock)
+    def test_lock_acquire_is_interrupted(self):
+        with self.assertRaisesRegex(AssertionError, "in deadlock"):
+            self.result()
+
+    @args(lambda: time.sleep(3))
+    def test_stack_written_when_timeout_exceeded(self):
+        with self.assertRaises(AssertionError):
+            self.result()
+        self.assertIn("did not complete within 0.05 seconds", self.stream.getvalue())
+        self.assertIn("in subject", self.stream.getvalue())
@@ -0,0 +1,144 @@
+import os
+import sys
+import tempfile
+import unittest
+from io import StringIO
+from textwrap import dedent
+
+from unittest_extensions import TestCase
+from unittest_extensions.watch import Watcher
+
+SOURCE = """
+def value():
+    return {value}
+"""
+
+TESTS = """
+from unittest_extensions import TestCase, args
+
+import {source}
+
+
+class TestValue(TestCase):
+    def subject(self):
+        return {source}.value()
+
+    def test_value(self):
+        self.assertResult(1)
+
+
+class TestIndependent(TestCase):
+    def subject(self, a):
+        return a
+
+    @args(1)
+    def test_identity(self):
+        self.assertResult(1)
+"""
+
+BASE = """
+from unittest_extensions import TestCase
+
+import {source}
+
+
+class Base(TestCase):
+    def subject(self):
+        return {source}.value()
+"""
+
+INHERITING_TESTS = """
+from {base} import Base
+
+
+class TestInherited(Base):
+    def test_value(self):
+        self.assertResult(1)
+"""
+
+
+class TestWatcher(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.source = "watched_source_" + str(id(self))
+        self.tests = "watched_tests_" + str(id(self))
+        self.write(self.source, SOURCE.format(value=1))
+        self.write(self.tests, TESTS.format(source=self.source))
+        sys.path.insert(0, self.directory.name)
+        self.addCleanup(sys.path.remove, self.directory.name)
+        self.addCleanup(sys.modules.pop, self.source, None)
+        self.addCleanup(sys.modules.pop, self.tests, None)
+        module = __import__(self.tests)
+        suite = unittest.defaultTestLoader.loadTestsFromModule(module)
+        runner = unittest.TextTestRunner(stream=StringIO())
+        self.watcher = Watcher(suite, [self.directory.name], runner)
+
+    def write(self, name, content):
+        path = os.path.join(self.directory.name, name + ".py")
+        mtime = os.stat(path).st_mtime_ns + 10**9 if os.path.exists(path) else None
+        with open(path, "w") as f:
+            f.write(dedent(content))
+        if mtime is not None:
+            os.utime(path, ns=(mtime, mtime))
+
+    def subject(self):
+        return self.watcher.step()
+
+    def test_nothing_changed(self):
+        self.assertResultIs(None)
+
+    def test_source_changed_reruns_dependent_class(self):
+        self.write(self.source, SOURCE.format(value=2))
+        result = self.result()
+        self.assertEqual(result.testsRun, 1)
+        self.assertEqual(len(result.failures), 1)
+
+    def test_tests_changed_reruns_module_classes(self):
+        self.write(self.tests, TESTS.format(source=self.source))
+        result = self.result()
+        self.assertEqual(result.testsRun, 2)
+        self.assertTrue(result.wasSuccessful())
+
+    def test_step_after_rerun(self):
+        self.write(self.source, SOURCE.format(value=2))
+        self.result()
+        self.assertResultIs(None)
+
+
+class TestWatcherInheritedSubject(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        suffix = str(id(self))
+        self.source = "watched_source_" + suffix
+        self.base = "watched_base_" + suffix
+        self.tests = "watched_tests_" + suffix
+        self.write(self.source, SOURCE.format(value=1))
+        self.write(self.base, BASE.format(source=self.source))
+        self.write(self.tests, INHERITING_TESTS.format(base=self.base))
+        sys.path.insert(0, self.directory.name)
+        self.addCleanup(sys.path.remove, self.directory.name)
+        for name in (self.source, self.base, self.tests):
+            self.addCleanup(sys.modules.pop, name, None)
+        module = __import__(self.tests)
+        suite = unittest.defaultTestLoader.loadTestsFromModule(module)
+        runner = unittest.TextTestRunner(stream=StringIO())
+        self.watcher = Watcher(suite, [self.directory.name], runner)
+
+    write = TestWatcher.write
+
+    def subject(self):
+        return self.watcher.step()
+
+    def test_source_of_inherited_subject_changed(self):
+        self.write(self.source, SOURCE.format(value=2))
+        result = self.result()
+        self.assertEqual(result.testsRun, 1)
+        self.assertEqual(len(result.failures), 1)
+
+    def test_base_changed(self):
+        self.write(self.base, BASE.format(source=self.source))
+        result = self.result()
+        self.assertEqual(result.testsRun, 1)
+        self.assertTrue(result.wasSuccessful())
@@ -0,0 +1,333 @@
+"""
+Watch mode: import a test suite once, keep the interpreter warm and, whenever a
+watched source file changes, reload it and rerun only the test-case classes that
+depend on it.
+
+Run it from the command line with
+
+    python -m unittest_extensions.watch [start_dir] [-p pattern] [-w path ...]
+
+or from Python with `watch(...)`.
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+import traceback
+import unittest
+from types import CodeType, FunctionType, ModuleType
+from typing import (
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from unittest import TestCase as BaseTestCase
+
+_ClassKey = Tuple[str, str]
+
+
+def _iter_tests(suite: unittest.TestSuite) -> Iterator[BaseTestCase]:
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_tests(test)
+        else:
+            yield test
+
+
+def _iter_code_names(code: CodeType) -> Iterator[str]:
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            yield from _iter_code_names(const)
+
+
+def _module_of(obj) -> Optional[str]:
+    if isinstance(obj, ModuleType):
+        return obj.__name__
+    module = getattr(obj, "__module__", None)
+    return module if isinstance(module, str) else None
+
+
+def _module_dependencies(module: ModuleType) -> Set[str]:
+    """
+    Return the names of the modules that the globals of `module` come from.
+    """
+    dependencies = set()
+    for value in list(vars(module).values()):
+        name = _module_of(value)
+        if name is not None and name != module.__name__:
+            dependencies.add(name)
+    return dependencies
+
+
+def _functions_of(obj, modules: Collection[str]) -> Iterator[FunctionType]:
+    if isinstance(obj, FunctionType):
+        yield obj
+    elif isinstance(obj, type):
+        for klass in obj.__mro__:
+            if klass.__module__ not in modules:
+                continue
+            for value in vars(klass).values():
+                value = getattr(value, "__func__", value)
+                value = getattr(value, "__wrapped__", value)
+                if isinstance(value, property):
+                    value = value.fget
+                if isinstance(value, FunctionType):
+                    yield value
+
+
+def _class_dependencies(cls: type, watched: Collection[str] = ()) -> Set[str]:
+    """
+    Return the names of the modules that the methods of `cls` (including its
+    `subject`) refer to.
+
+    Methods inherited from base classes defined in `watched` modules are
+    inspected too. Helpers
+    defined in the module of a method are followed, so that a test-case class
+    depends on what its helpers use rather than on everything its module
+    imports.
+    """
+    modules = set(watched) | {cls.__module__}
+    dependencies: Set[str] = set()
+    seen: Set[int] = set()
+    pending: List[object] = [cls]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        for function in _functions_of(obj, modules):
+            namespace = function.__globals__
+            home = namespace.get("__name__")
+            for name in _iter_code_names(function.__code__):
+                if name not in namespace:
+                    continue
+                value = namespace[name]
+                module = _module_of(value)
+                if module is None:
+                    continue
+                if module == home and not isinstance(value, ModuleType):
+                    pending.append(value)
+                elif module != home:
+                    dependencies.add(module)
+    dependencies.discard(cls.__module__)
+    return dependencies
+
+
+class Watcher:
+    """
+    Keep a discovered test suite in memory and rerun the affected parts of it
+    when watched source files change.
+
+    Only modules that are already imported and whose files live under one of
+    `paths` are watched; restart the watcher to pick up newly created modules.
+    """
+
+    def __init__(
+        self,
+        suite: unittest.TestSuite,
+        paths: Sequence[str] = (".",),
+        runner: Optional[unittest.TextTestRunner] = None,
+        loader: Optional[unittest.TestLoader] = None,
+    ):
+        self.paths = tuple(os.path.abspath(p) + os.sep for p in paths)
+        self.runner = runner or unittest.TextTestRunner()
+        self.loader = loader or unittest.TestLoader()
+        self._classes: Dict[_ClassKey, type] = {}
+        for test in _iter_tests(suite):
+            cls = type(test)
+            if cls.__module__ in sys.modules:
+                self._classes[(cls.__module__, cls.__qualname__)] = cls
+        self._mtimes = self._stat()
+
+    def _watched(self) -> Dict[str, ModuleType]:
+        modules = {}
+        for name, module in list(sys.modules.items()):
+            path = getattr(module, "__file__", None)
+            if path and os.path.abspath(path).startswith(self.paths):
+                modules[name] = module
+        return modules
+
+    def _stat(self) -> Dict[str, int]:
+        mtimes = {}
+        for name, module in self._watched().items():
+            if module.__file__ is None:
+                continue
+            try:
+                mtimes[name] = os.stat(module.__file__).st_mtime_ns
+            except OSError:
+                continue
+        return mtimes
+
+    def poll(self) -> Set[str]:
+        """
+        Return the names of the watched modules whose files changed since the
+        last poll.
+        """
+        mtimes = self._stat()
+        changed = {
+            name
+            for name, mtime in mtimes.items()
+            if self._mtimes.get(name, mtime) != mtime
+        }
+        self._mtimes.update(mtimes)
+        return changed
+
+    def _dependents(self, changed: Set[str]) -> List[str]:
+        """
+        Return `changed` and the watched modules depending on it, transitively,
+        ordered so that every module comes after the modules it depends on.
+        """
+        watched = self._watched()
+        dependencies = {
+            name: _module_dependencies(module) & watched.keys()
+            for name, module in watched.items()
+        }
+        affected = set(changed)
+        grew = True
+        while grew:
+            grew = False
+            for name, deps in dependencies.items():
+                if name not in affected and deps & affected:
+                    affected.add(name)
+                    grew = True
+
+        ordered: List[str] = []
+        visiting: Set[str] = set()
+
+        def visit(name: str):
+            if name in ordered or name in visiting:
+                return
+            visiting.add(name)
+            for dep in sorted(dependencies.get(name, set()) & affected):
+                visit(dep)
+            ordered.append(name)
+
+        for name in sorted(affected):
+            visit(name)
+        return ordered
+
+    def affected(self, changed: Set[str]) -> List[_ClassKey]:
+        """
+        Return the keys of the test-case classes to rerun after `changed`
+        modules were modified: those defined, or inheriting from a class
+        defined, in a changed module, and those whose methods, inherited ones
+        included, refer to a changed module or one depending on it.
+        """
+        closure = set(self._dependents(changed))
+        watched = self._watched().keys()
+        keys = []
+        for key, cls in self._classes.items():
+            bases = {klass.__module__ for klass in cls.__mro__}
+            if bases & changed or _class_dependencies(cls, watched) & closure:
+                keys.append(key)
+        return keys
+
+    def _reload(self, names: Iterable[str]):
+        for name in names:
+            module = sys.modules.get(name)
+            if module is not None:
+                importlib.reload(module)
+        for key in list(self._classes):
+            obj = sys.modules.get(key[0])
+            for attr in key[1].split("."):
+                obj = getattr(obj, attr, None)
+            if isinstance(obj, type):
+                self._classes[key] = obj
+            else:
+                del self._classes[key]
+
+    def step(self) -> Optional[unittest.TestResult]:
+        """
+        Poll once; if anything changed, reload it and rerun the affected
+        test-case classes. Return the result of the run, or None if nothing was
+        run.
+        """
+        changed = self.poll()
+        if not changed:
+            return None
+        keys = self.affected(changed)
+        try:
+            self._reload(self._dependents(changed))
+        except Exception:
+            traceback.print_exc()
+            return None
+        suite = unittest.TestSuite(
+            self.loader.loadTestsFromTestCase(self._classes[key])
+            for key in keys
+            if key in self._classes
+        )
+        if suite.countTestCases() == 0:
+            return None
+        return self.runner.run(suite)
+
+    def run(self, interval: float = 0.5):
+        """
+        Poll every `interval` seconds until interrupted.
+        """
+        try:
+            while True:
+                self.step()
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+
+
+def watch(
+    start_dir: str = ".",
+    pattern: str = "test*.py",
+    top_level_dir: Optional[str] = None,
+    paths: Optional[Sequence[str]] = None,
+    interval: float = 0.5,
+    verbosity: int = 1,
+):
+    """
+    Discover the tests under `start_dir`, run them once and then rerun the
+    affected test-case classes whenever a module under `paths` (by default the
+    current working directory) changes.
+
+    Examples:
+        >>> from unittest_extensions.watch import watch
+
+        >>> watch("src/my_package/tests", paths=["src"])  # doctest: +SKIP
+    """
+    loader = unittest.TestLoader()
+    suite = loader.discover(start_dir, pattern, top_level_dir)
+    runner = unittest.TextTestRunner(verbosity=verbosity)
+    runner.run(suite)
+    Watcher(suite, paths or (os.getcwd(),), runner, loader).run(interval)
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m unittest_extensions.watch",
+        description="Rerun affected tests whenever watched source files change.",
+    )
+    parser.add_argument("start_dir", nargs="?", default=".")
+    parser.add_argument("-p", "--pattern", default="test*.py")
+    parser.add_argument("-t", "--top-level-directory", default=None)
+    parser.add_argument("-w", "--watch", action="append", dest="paths", metavar="PATH")
+    parser.add_argument("-i", "--interval", type=float, default=0.5)
+    parser.add_argument("-v", "--verbose", action="store_const", const=2, default=1)
+    options = parser.parse_args(argv)
+    watch(
+        options.start_dir,
+        options.pattern,
+        options.top_level_directory,
+        options.paths,
+        options.interval,
+        options.verbose,
+    )
+
+
+if __name__ == "__main__":
+    main()
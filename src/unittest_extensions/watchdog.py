@@ -0,0 +1,223 @@
+import ctypes
+import faulthandler
+import re
+import signal
+import sys
+import threading
+import time
+from tempfile import TemporaryFile
+from time import monotonic
+from typing import IO, Any, Callable, List, Optional
+
+from unittest_extensions.error import TestError
+
+_THREAD_HEADER = re.compile(r"^(?:Current )?[Tt]hread (0x[0-9a-fA-F]+)", re.MULTILINE)
+
+# Seconds to wait for the interrupting signal to be handled once a call that
+# timed out returned on its own, before restoring the previous handler.
+_SIGNAL_GRACE = 0.1
+
+
+class Timeout(TestError):
+    """
+    Raised by `call_within` when the call does not complete in time.
+    """
+
+    def __init__(self, seconds: float, stack: str):
+        super().__init__(
+            f"Call did not complete within {seconds} seconds; its stack is:\n{stack}"
+        )
+        self.seconds = seconds
+        self.stack = stack
+
+
+class _Interrupt(BaseException):
+    """
+    Raised in a thread whose call timed out. Derives from BaseException so that
+    `except Exception` in the call does not swallow it.
+    """
+
+
+def _set_async_exception(ident: int, exception: Optional[type]) -> int:
+    return ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        ctypes.c_ulong(ident), ctypes.py_object(exception) if exception else None
+    )
+
+
+def _can_signal() -> bool:
+    return (
+        hasattr(signal, "SIGALRM")
+        and hasattr(signal, "pthread_kill")
+        and threading.current_thread() is threading.main_thread()
+    )
+
+
+class _Watch:
+    def __init__(self, ident: int, seconds: float, signal_: bool):
+        self.ident = ident
+        self.seconds = seconds
+        self.deadline = monotonic() + seconds
+        self.signal = signal_
+        self.lock = threading.Lock()
+        self.done = False
+        self.interrupted = False
+        self.stack: Optional[str] = None
+
+
+class _Watchdog:
+    """
+    A single daemon thread that waits for the deadlines of all running calls
+    and, when one passes, writes the stack of the calling thread to `stream`
+    (by default the standard error of the process) and interrupts it.
+    """
+
+    def __init__(self):
+        self.stream: Optional[IO[str]] = None
+        self._condition = threading.Condition()
+        self._watches: List[_Watch] = []
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, watch: _Watch):
+        with self._condition:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="unittest-extensions-watchdog", daemon=True
+                )
+                self._thread.start()
+            self._watches.append(watch)
+            self._condition.notify()
+
+    def unwatch(self, watch: _Watch):
+        with watch.lock:
+            watch.done = True
+        with self._condition:
+            if watch in self._watches:
+                self._watches.remove(watch)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                now = monotonic()
+                expired = [w for w in self._watches if w.deadline <= now]
+                for watch in expired:
+                    self._watches.remove(watch)
+                if not expired:
+                    deadlines = [w.deadline for w in self._watches]
+                    self._condition.wait(min(deadlines) - now if deadlines else None)
+                    continue
+            for watch in expired:
+                self._fire(watch)
+
+    def _fire(self, watch: _Watch):
+        with watch.lock:
+            if watch.done:
+                return
+            watch.stack = thread_stack(watch.ident)
+            # Written right away, in case the call cannot be interrupted.
+            self._write(
+                f"Call did not complete within {watch.seconds} seconds; "
+                f"its stack is:\n{watch.stack}\n"
+            )
+            if watch.signal:
+                # Interrupts blocking calls such as lock waits and sleeps too.
+                signal.pthread_kill(watch.ident, signal.SIGALRM)
+            else:
+                # Delivered only once the thread runs Python code again.
+                _set_async_exception(watch.ident, _Interrupt)
+
+    def _write(self, text: str):
+        stream = self.stream or sys.__stderr__
+        if stream is None:
+            return
+        try:
+            stream.write(text)
+            stream.flush()
+        except (OSError, ValueError):
+            pass
+
+
+_watchdog = _Watchdog()
+
+
+def _install_handler(watch: _Watch):
+    previous = signal.getsignal(signal.SIGALRM)
+
+    def handler(signum, frame):
+        if watch.stack is not None and not watch.interrupted:
+            watch.interrupted = True
+            raise _Interrupt()
+        if callable(previous):
+            previous(signum, frame)
+
+    signal.signal(signal.SIGALRM, handler)
+    return previous
+
+
+def _await_interrupt(watch: _Watch):
+    # The signal sent by the watchdog may still be pending if the call returned
+    # on its own just after timing out; restoring the previous handler before
+    # it is handled would drop it with a warning.
+    deadline = monotonic() + _SIGNAL_GRACE
+    try:
+        while not watch.interrupted and monotonic() < deadline:
+            time.sleep(0.001)
+    except _Interrupt:
+        pass
+
+
+def call_within(seconds: float, function: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Call `function` and return its result, or raise `Timeout` with a dump of
+    the stack of the call if it does not complete within `seconds`.
+
+    The call runs on the calling thread; a single shared watchdog thread writes
+    the stack of the call to standard error as soon as the timeout is exceeded
+    and interrupts the call. On the main thread of POSIX systems the call is
+    interrupted with SIGALRM, which also ends blocking calls such as lock
+    waits, sleeps and socket reads. On other threads it is interrupted only
+    once it runs Python code again, so a call blocked there is only reported.
+    """
+    signal_ = _can_signal()
+    watch = _Watch(threading.get_ident(), seconds, signal_)
+    # The handler is installed before the watch starts, since SIGALRM ends
+    # the process by default.
+    previous = _install_handler(watch) if signal_ else None
+    _watchdog.watch(watch)
+    try:
+        try:
+            result = function(*args, **kwargs)
+        finally:
+            _watchdog.unwatch(watch)
+    except _Interrupt:
+        if watch.stack is None:
+            raise
+    finally:
+        if signal_:
+            if watch.stack is not None:
+                _await_interrupt(watch)
+            # Handlers installed from C cannot be restored from Python.
+            restored = signal.SIG_DFL if previous is None else previous
+            signal.signal(signal.SIGALRM, restored)
+        elif watch.stack is not None:
+            # Clear the interrupt in case it is still pending.
+            _set_async_exception(watch.ident, None)
+    if watch.stack is not None:
+        raise Timeout(seconds, watch.stack)
+    return result
+
+
+def thread_stack(ident: int) -> str:
+    """
+    Return the stack of the thread with identifier `ident` as dumped by
+    `faulthandler`, or the stacks of all threads if that of the thread cannot
+    be told apart.
+    """
+    with TemporaryFile("w+") as f:
+        faulthandler.dump_traceback(f, all_threads=True)
+        f.seek(0)
+        dump = f.read()
+    for block in dump.split("\n\n"):
+        match = _THREAD_HEADER.search(block)
+        if match is not None and int(match.group(1), 16) == ident:
+            return block.strip()
+    return dump.strip()